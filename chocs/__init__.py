@@ -1,5 +1,7 @@
 from chocs.http import *
+
 from .application import Application
+from .asgi.asgi_support import create_asgi_handler
 from .middleware.application_middleware import RequestHandlerMiddleware
-from .routing import Route, Router
+from .routing import Route, RouteMatch, Router, RouterEngine
 from .wsgi.wsgi_support import WsgiServers, create_wsgi_handler, serve
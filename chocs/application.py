@@ -1,16 +1,17 @@
 import glob
 import importlib
 from os import path, getcwd
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from .errors import ApplicationError
-from .http.http_error import NotFoundError
+from .http.http_error import MethodNotAllowedError, NotFoundError
 from .http.http_method import HttpMethod
 from .http.http_request import HttpRequest
-from .http.http_response import HttpResponse
-from .middleware.application_middleware import RequestHandlerMiddleware
-from .middleware.middleware import Middleware, MiddlewarePipeline
-from .routing import Route, Router
+from .http.http_response import HttpResponse, StreamingHttpResponse
+from .http.http_status import HttpStatus
+from .middleware.application_middleware import RequestHandlerMiddleware, RouteHandler, as_async_handler
+from .middleware.middleware import AsyncMiddleware, AsyncMiddlewareHandler, Middleware, MiddlewarePipeline
+from .routing import Route, RouteMatch, Router
 from .serverless.wrapper import create_serverless_function, is_serverless
 
 
@@ -48,91 +49,145 @@ class _Loader:
         return loaded
 
 
+def _strip_body(request: HttpRequest, next: Callable) -> HttpResponse:
+    response = next(request)
+    if isinstance(response, StreamingHttpResponse) and response.streaming:
+        # Length of streamed body is not known, so empty response stays streaming and does not advertise any
+        stripped = StreamingHttpResponse(iter(()), response.status_code, response.headers, response.encoding)
+        stripped.cookies = response.cookies
+        response.close()
+
+        return stripped
+
+    # HEAD response advertises the length of the body GET would send
+    if "content-length" not in response.headers:
+        response.headers.set("content-length", str(response.body.getbuffer().nbytes))
+    response.body = b""
+
+    return response
+
+
 class Application:
-    def __init__(self, *middleware: Union[Middleware, Callable]):
+    def __init__(self, *middleware: Union[Middleware, AsyncMiddleware, Callable]):
         self.parent: Optional[Application] = None
         self._middleware = MiddlewarePipeline()
         for item in middleware:
             self._middleware.append(item)
 
         self.namespace = ["/"]
+        self.hosts: List[Optional[str]] = [None]
+        self.middleware_groups: List[Tuple[Union[Middleware, Callable], ...]] = [()]
         self.router = Router()
         self._loaded_modules: List[str] = []
         self._cached_middleware: Optional[MiddlewarePipeline] = None
+        self._request_handler_middleware: Optional[RequestHandlerMiddleware] = None
+        self._head_handlers: Dict[Callable, RouteHandler] = {}
+        self._async_handlers: Dict[Callable, AsyncMiddlewareHandler] = {}
 
     def _append_route(
         self,
-        method: HttpMethod,
+        methods: Union[HttpMethod, List[HttpMethod]],
         route: Route,
         handler: Callable[[HttpRequest], HttpResponse],
     ):
         if self.parent:
-            self.parent._append_route(method, route, handler)
+            self.parent._append_route(methods, route, handler)
 
-        self.router.append(route, handler, method)
+        self.router.append(route, handler, methods, self.hosts[-1])
+        # Handler is wrapped for asynchronous pipeline once, instead of for each request
+        if handler not in self._async_handlers:
+            self._async_handlers[handler] = as_async_handler(handler)
 
     def _create_route(self, route: str, attributes: dict) -> Route:
         base_uri = "".join(self.namespace[1:])
         return Route(base_uri + route, attributes)
 
-    def get(self, route: str, **attributes) -> Callable:
-        return self._create_route_handler(route, HttpMethod.GET, **attributes)
+    def get(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(route, HttpMethod.GET, middleware, attributes)
 
-    def post(self, route: str, **attributes) -> Callable:
-        return self._create_route_handler(route, HttpMethod.POST, **attributes)
+    def post(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(route, HttpMethod.POST, middleware, attributes)
 
-    def put(self, route: str, **attributes) -> Callable:
-        return self._create_route_handler(route, HttpMethod.PUT, **attributes)
+    def put(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(route, HttpMethod.PUT, middleware, attributes)
 
-    def patch(self, route: str, **attributes) -> Callable:
-        return self._create_route_handler(route, HttpMethod.PATCH, **attributes)
+    def patch(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(route, HttpMethod.PATCH, middleware, attributes)
 
-    def delete(self, route: str, **attributes) -> Callable:
-        return self._create_route_handler(route, HttpMethod.DELETE, **attributes)
+    def delete(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(route, HttpMethod.DELETE, middleware, attributes)
 
-    def head(self, route: str, **attributes) -> Callable:
-        return self._create_route_handler(route, HttpMethod.HEAD, **attributes)
+    def head(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(route, HttpMethod.HEAD, middleware, attributes)
 
-    def options(self, route: str, **attributes) -> Callable:
-        return self._create_route_handler(route, HttpMethod.OPTIONS, **attributes)
+    def options(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(route, HttpMethod.OPTIONS, middleware, attributes)
 
-    def _create_route_handler(self, route: str, method: HttpMethod, **attributes):
+    def _create_route_handler(
+        self,
+        route: str,
+        methods: Union[HttpMethod, List[HttpMethod]],
+        middleware: Sequence[Union[Middleware, Callable]],
+        attributes: Dict[str, Any],
+    ) -> Callable:
         def _handler(handler: Callable) -> Callable:
             local_route = self._create_route(route, attributes)
-            # handler = _wrap_request_handler(handler, local_route)
-            self._append_route(method, local_route, handler)
+            route_middleware = self.middleware_groups[-1] + tuple(middleware)
+            if route_middleware:
+                self._append_route(methods, local_route, RouteHandler(handler, route_middleware))
+            else:
+                self._append_route(methods, local_route, handler)
+
             if is_serverless():
-                return create_serverless_function(handler, local_route, self._middleware)
+                return create_serverless_function(
+                    handler, local_route, MiddlewarePipeline(self._middleware.queue + list(route_middleware))
+                )
 
             return handler
 
         return _handler
 
-    def any(self, route: str, **attributes) -> Callable:
-        def _any(handler: Callable) -> Callable:
-            local_route = self._create_route(route, attributes)
-            self._append_route(HttpMethod.GET, local_route, handler)
-            self._append_route(HttpMethod.POST, local_route, handler)
-            self._append_route(HttpMethod.PUT, local_route, handler)
-            self._append_route(HttpMethod.PATCH, local_route, handler)
-            self._append_route(HttpMethod.DELETE, local_route, handler)
-            self._append_route(HttpMethod.HEAD, local_route, handler)
-            self._append_route(HttpMethod.OPTIONS, local_route, handler)
-
-            if is_serverless():
-                return create_serverless_function(handler, local_route, self._middleware)
-            return handler
-
-        return _any
-
-    def group(self, base_route: str) -> "Application":
+    def any(self, route: str, *middleware: Union[Middleware, Callable], **attributes) -> Callable:
+        return self._create_route_handler(
+            route,
+            [
+                HttpMethod.GET,
+                HttpMethod.POST,
+                HttpMethod.PUT,
+                HttpMethod.PATCH,
+                HttpMethod.DELETE,
+                HttpMethod.HEAD,
+                HttpMethod.OPTIONS,
+            ],
+            middleware,
+            attributes,
+        )
+
+    def group(self, base_route: str, *middleware: Union[Middleware, Callable]) -> "Application":
+        """
+        Middleware passed to the group is run only for the routes defined within the group.
+        """
         self.namespace.append(base_route)
+        self.hosts.append(self.hosts[-1])
+        self.middleware_groups.append(self.middleware_groups[-1] + middleware)
+        return self
+
+    def host(self, host: str, *middleware: Union[Middleware, Callable]) -> "Application":
+        """
+        Routes defined within the host are matched only for requests with corresponding `Host` header.
+        Host can contain variables (e.g. `{tenant}.example.com`), which are passed to path parameters.
+        """
+        self.namespace.append("")
+        self.hosts.append(host)
+        self.middleware_groups.append(self.middleware_groups[-1] + middleware)
         return self
 
     def __enter__(self) -> "Application":
         child_app = Application()
         child_app._middleware = self._middleware
         child_app.namespace = self.namespace
+        child_app.hosts = self.hosts
+        child_app.middleware_groups = self.middleware_groups
         child_app.parent = self
         child_app._loaded_modules = self._loaded_modules
 
@@ -140,11 +195,26 @@ class Application:
 
     def __exit__(self, *args) -> "Application":
         self.namespace.pop()
+        self.hosts.pop()
+        self.middleware_groups.pop()
         return self
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        self._dispatch(request)
+        request_handler = self._request_handler
+        return request_handler(request)
+
+    async def call_async(self, request: HttpRequest) -> HttpResponse:
+        """
+        Handles request within running event loop. Coroutine handlers and middleware are awaited,
+        synchronous ones are run in the thread pool (see `chocs.concurrency.set_max_workers`).
+        """
+        self._dispatch(request)
+        return await self._async_request_handler(request)
+
+    def _dispatch(self, request: HttpRequest) -> None:
         try:
-            route, handler = self.router.match(request.path, request.method)
+            route, handler = self._match_route(request, request.method)
             request.path_parameters = route.parameters
             request.route = route
             request.attributes["__handler__"] = handler
@@ -154,9 +224,51 @@ class Application:
                 raise NotFoundError()
 
             request.attributes["__handler__"] = _handler
+        except MethodNotAllowedError as error:
+            request.attributes["__handler__"] = self._create_method_not_allowed_handler(request, error)
 
-        request_handler = self._request_handler
-        return request_handler(request)
+    def _match_route(self, request: HttpRequest, method: HttpMethod) -> Tuple[RouteMatch, Callable]:
+        if self.router.host_routing:
+            return self.router.match(request.path, method, str(request.headers.get("host")))
+
+        return self.router.match(request.path, method)
+
+    def _create_method_not_allowed_handler(self, request: HttpRequest, error: MethodNotAllowedError) -> Callable:
+        allowed_methods = error.allowed_methods
+        if str(HttpMethod.GET) in allowed_methods and str(HttpMethod.HEAD) not in allowed_methods:
+            allowed_methods.insert(allowed_methods.index(str(HttpMethod.GET)) + 1, str(HttpMethod.HEAD))
+        if str(HttpMethod.OPTIONS) not in allowed_methods:
+            allowed_methods.append(str(HttpMethod.OPTIONS))
+
+        if request.method == HttpMethod.OPTIONS:
+
+            def _options_handler(_: HttpRequest) -> HttpResponse:
+                return HttpResponse(status=HttpStatus.NO_CONTENT, headers=error.headers)
+
+            return _options_handler
+
+        if request.method == HttpMethod.HEAD and str(HttpMethod.GET) in allowed_methods:
+            route, handler = self._match_route(request, HttpMethod.GET)
+            request.path_parameters = route.parameters
+            request.route = route
+
+            if handler not in self._head_handlers:
+                self._head_handlers[handler] = RouteHandler(handler, [_strip_body])
+
+            return self._head_handlers[handler]
+
+        def _handler(_: HttpRequest) -> HttpResponse:
+            raise error
+
+        return _handler
+
+    def freeze(self) -> None:
+        self.router.freeze()
+        self._request_handler.compile()
+        self._middleware.compile_async(self._get_request_handler_middleware())
+
+    def url_for(self, name: str, **parameters: Any) -> str:
+        return self.router.url_for(name, **parameters)
 
     def use(self, namespace: str) -> None:
         try:
@@ -168,10 +280,20 @@ class Application:
     def _request_handler(self) -> MiddlewarePipeline:
         if self._cached_middleware is None:
             middleware = MiddlewarePipeline(self._middleware.queue)
-            middleware.append(RequestHandlerMiddleware(self.router))
+            middleware.append(self._get_request_handler_middleware())
             self._cached_middleware = middleware
 
         return self._cached_middleware
 
+    @property
+    def _async_request_handler(self) -> AsyncMiddlewareHandler:
+        return self._middleware.compile_async(self._get_request_handler_middleware())
+
+    def _get_request_handler_middleware(self) -> RequestHandlerMiddleware:
+        if self._request_handler_middleware is None:
+            self._request_handler_middleware = RequestHandlerMiddleware(self.router, self._async_handlers)
+
+        return self._request_handler_middleware
+
 
 __all__ = ["Application"]
@@ -0,0 +1 @@
+from .asgi_support import create_asgi_handler
@@ -0,0 +1,141 @@
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from chocs.application import Application
+from chocs.http.http_error import HttpError
+from chocs.http.http_headers import HttpHeaders
+from chocs.http.http_method import HttpMethod
+from chocs.http.http_query_string import HttpQueryString
+from chocs.http.http_request import HttpRequest
+from chocs.http.http_response import HttpResponse, StreamingHttpResponse
+
+AsgiScope = Dict[str, Any]
+AsgiMessage = Dict[str, Any]
+AsgiReceive = Callable[[], Awaitable[AsgiMessage]]
+AsgiSend = Callable[[AsgiMessage], Awaitable[None]]
+AsgiHandler = Callable[[AsgiScope, AsgiReceive, AsgiSend], Awaitable[None]]
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ClientDisconnected(Exception):
+    pass
+
+
+async def create_http_request_from_asgi(scope: AsgiScope, receive: AsgiReceive) -> HttpRequest:
+    headers = HttpHeaders()
+    for name, value in scope.get("headers", []):
+        headers.set(name.decode("latin-1"), value.decode("latin-1"))
+    if "content-type" not in headers:
+        headers.set("Content-Type", "text/plain")
+
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise ClientDisconnected()
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+
+    return HttpRequest(
+        method=HttpMethod(scope.get("method", "GET").upper()),
+        path=scope.get("path", "/"),
+        body=b"".join(chunks),
+        query_string=HttpQueryString(scope.get("query_string", b"").decode("latin-1")),
+        headers=headers,
+    )
+
+
+def _create_response_headers(response: HttpResponse) -> List[Tuple[bytes, bytes]]:
+    headers = [(key.encode("latin-1"), value.encode("latin-1")) for key, value in response.headers.as_list()]
+    for cookie in response.cookies.values():
+        headers.append((b"set-cookie", cookie.serialise().encode("latin-1")))
+
+    return headers
+
+
+async def send_asgi_response(response: HttpResponse, send: AsgiSend) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": int(response.status_code),
+            "headers": _create_response_headers(response),
+        }
+    )
+
+    if isinstance(response, StreamingHttpResponse) and response.streaming:
+        try:
+            async for chunk in response:
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            response.close()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+        return
+
+    body = response.body
+    body.seek(0)
+    chunk = body.read(CHUNK_SIZE)
+    while True:
+        next_chunk = body.read(CHUNK_SIZE)
+        await send({"type": "http.response.body", "body": chunk, "more_body": bool(next_chunk)})
+        if not next_chunk:
+            break
+        chunk = next_chunk
+
+
+async def _handle_lifespan(application: Application, receive: AsgiReceive, send: AsgiSend) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                application.freeze()
+            except Exception as error:
+                await send({"type": "lifespan.startup.failed", "message": str(error)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+def create_asgi_handler(application: Application, debug: bool = False) -> AsgiHandler:
+    """
+    Creates ASGI 3 application, coroutine handlers and middleware are awaited within server's event loop,
+    synchronous ones are run in the thread pool.
+    """
+    application.freeze()
+
+    async def _handler(scope: AsgiScope, receive: AsgiReceive, send: AsgiSend) -> None:
+        if scope["type"] == "lifespan":
+            await _handle_lifespan(application, receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise RuntimeError(f"Unsupported ASGI scope type `{scope['type']}`.")
+
+        try:
+            request = await create_http_request_from_asgi(scope, receive)
+        except ClientDisconnected:
+            return
+
+        if debug:
+            try:
+                response = await application.call_async(request)
+            except HttpError as http_error:
+                response = HttpResponse(http_error.http_message, http_error.status_code, http_error.headers)
+        else:
+            # Always send a response
+            try:
+                response = await application.call_async(request)
+            except HttpError as http_error:
+                response = HttpResponse(http_error.http_message, http_error.status_code, http_error.headers)
+            except Exception:
+                response = HttpResponse("Internal Server Error", 500)
+
+        await send_asgi_response(response, send)
+
+    return _handler
+
+
+__all__ = ["create_asgi_handler", "create_http_request_from_asgi", "send_asgi_response"]
@@ -0,0 +1,125 @@
+import asyncio
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from functools import partial
+from queue import SimpleQueue
+from typing import Any, Callable, Coroutine, Optional, Tuple
+
+_max_workers: int = min(32, (os.cpu_count() or 1) + 4)
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+class _WaitingThreadExecutor:
+    """
+    Runs synchronous work offloaded by a coroutine in the worker thread which waits for that coroutine.
+    Otherwise chain of sync -> async -> sync middleware would need another worker for each synchronous
+    step and could exhaust the thread pool.
+    """
+
+    def __init__(self):
+        self._queue: "SimpleQueue[Optional[Tuple[Future, Callable]]]" = SimpleQueue()
+        self._closed = False
+
+    def submit(self, func: Callable) -> Future:
+        if self._closed:
+            return get_executor().submit(func)
+
+        future: Future = Future()
+        self._queue.put((future, func))
+        return future
+
+    def run_until_complete(self, future: Future) -> Any:
+        future.add_done_callback(lambda _: self._queue.put(None))
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self._run(*item)
+
+        self._closed = True
+        while not self._queue.empty():
+            item = self._queue.get()
+            if item is not None:
+                self._run(*item)
+
+        return future.result()
+
+    @staticmethod
+    def _run(future: Future, func: Callable) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except BaseException as error:
+            future.set_exception(error)
+
+
+_waiting_thread_executor: "ContextVar[Optional[_WaitingThreadExecutor]]" = ContextVar(
+    "chocs_waiting_thread_executor", default=None
+)
+
+
+def set_max_workers(max_workers: int) -> None:
+    """
+    Sets size of the thread pool used to run synchronous handlers and middleware in async mode.
+    """
+    global _max_workers, _executor
+    if max_workers < 1:
+        raise ValueError("Thread pool must have at least one worker.")
+
+    _max_workers = max_workers
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="chocs")
+
+    return _executor
+
+
+async def run_in_threadpool(func: Callable, *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    call = partial(copy_context().run, func, *args)
+    waiting_thread_executor = _waiting_thread_executor.get()
+    if waiting_thread_executor is not None:
+        return await asyncio.wrap_future(waiting_thread_executor.submit(call), loop=loop)
+
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def run_coroutine_from_thread(coroutine: Coroutine, loop: asyncio.AbstractEventLoop) -> Any:
+    """
+    Runs coroutine in the event loop and blocks calling worker thread until it is done.
+    """
+    executor = _WaitingThreadExecutor()
+
+    async def _run() -> Any:
+        _waiting_thread_executor.set(executor)
+        return await coroutine
+
+    return executor.run_until_complete(asyncio.run_coroutine_threadsafe(_run(), loop))
+
+
+def run_coroutine(coroutine: Coroutine) -> Any:
+    """
+    Runs coroutine to completion in a new event loop, lets synchronous pipeline (WSGI, serverless)
+    call coroutine handlers and middleware. Within running event loop `call_async` must be used instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    coroutine.close()
+    raise RuntimeError(
+        "Coroutine handler or middleware cannot be called synchronously within running event loop, "
+        "use `Application.call_async` instead."
+    )
+
+
+__all__ = ["get_executor", "run_coroutine", "run_coroutine_from_thread", "run_in_threadpool", "set_max_workers"]
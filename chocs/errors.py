@@ -1,4 +1,4 @@
-from .http.http_error import HttpError, NotFoundError, BadRequestError
+from .http.http_error import BadRequestError, HttpError, MethodNotAllowedError, NotFoundError, PayloadTooLargeError
 
 
 class ApplicationError(RuntimeError):
@@ -7,4 +7,11 @@ class ApplicationError(RuntimeError):
         return ApplicationError(f"Failed to use namespace `{namespace}`")
 
 
-__all__ = ["ApplicationError", "HttpError", "NotFoundError", "BadRequestError"]
+__all__ = [
+    "ApplicationError",
+    "HttpError",
+    "NotFoundError",
+    "BadRequestError",
+    "MethodNotAllowedError",
+    "PayloadTooLargeError",
+]
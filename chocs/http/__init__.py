@@ -1,19 +1,46 @@
+from .http_body import HttpRequestBody
+from .http_content_type import (
+    negotiate_media_type,
+    parse_accept,
+    parse_content_disposition,
+    parse_content_type,
+    parse_header,
+)
 from .http_cookies import HttpCookie, HttpCookieJar
-from .http_error import NotFoundError, BadRequestError, HttpError
+from .http_error import BadRequestError, HttpError, MethodNotAllowedError, NotFoundError, PayloadTooLargeError
+from .http_file_response import FileResponse
 from .http_headers import HttpHeaders
+from .http_json import JsonCodec, OrjsonCodec, StdlibJsonCodec, get_json_codec, register_json_codec, set_json_codec
 from .http_message import (
     BinaryHttpMessage,
+    CborHttpMessage,
     CompositeHttpMessage,
     FormHttpMessage,
     HttpMessage,
     JsonHttpMessage,
+    MsgpackHttpMessage,
     MultipartHttpMessage,
     SimpleHttpMessage,
     YamlHttpMessage,
 )
 from .http_method import HttpMethod
-from .http_multipart_message_parser import UploadedFile, parse_multipart_message
+from .http_multipart_message_parser import (
+    UploadedFile,
+    UploadLimits,
+    parse_multipart_message,
+    parse_multipart_stream,
+    set_upload_limits,
+)
+from .http_parsed_body import HttpMessageParser, get_http_message_parser, register_http_message_parser
 from .http_query_string import HttpQueryString
 from .http_request import HttpRequest
-from .http_response import HttpResponse
+from .http_response import (
+    CborResponse,
+    HttpResponse,
+    JsonResponse,
+    MsgpackResponse,
+    SerialisedResponse,
+    StreamingHttpResponse,
+    negotiate_response,
+)
 from .http_status import HttpStatus
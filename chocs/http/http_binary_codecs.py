@@ -0,0 +1,74 @@
+from typing import Any, Union
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None  # type: ignore
+
+try:
+    import cbor2  # type: ignore
+except ImportError:
+    cbor2 = None  # type: ignore
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+CBOR_MEDIA_TYPES = ("application/cbor",)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def cbor_available() -> bool:
+    return cbor2 is not None
+
+
+def msgpack_dumps(value: Any) -> bytes:
+    if msgpack is None:
+        raise RuntimeError("`msgpack` package must be installed before using MessagePack messages.")
+
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def msgpack_loads(data: BytesLike) -> Any:
+    """
+    Raises `ValueError` when data is not a valid MessagePack document.
+    """
+    if msgpack is None:
+        raise RuntimeError("`msgpack` package must be installed before using MessagePack messages.")
+
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def cbor_dumps(value: Any) -> bytes:
+    if cbor2 is None:
+        raise RuntimeError("`cbor2` package must be installed before using CBOR messages.")
+
+    return cbor2.dumps(value)
+
+
+def cbor_loads(data: BytesLike) -> Any:
+    """
+    Raises `ValueError` when data is not a valid CBOR document.
+    """
+    if cbor2 is None:
+        raise RuntimeError("`cbor2` package must be installed before using CBOR messages.")
+
+    try:
+        return cbor2.loads(data)
+    except cbor2.CBORDecodeError as error:
+        # Since cbor2 6.0 decode error is no longer a `ValueError`
+        raise ValueError(str(error)) from error
+
+
+__all__ = [
+    "CBOR_MEDIA_TYPES",
+    "MSGPACK_MEDIA_TYPES",
+    "cbor_available",
+    "cbor_dumps",
+    "cbor_loads",
+    "msgpack_available",
+    "msgpack_dumps",
+    "msgpack_loads",
+]
@@ -1,5 +1,9 @@
+import io
 from io import BytesIO
-from typing import Union
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterator, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
 
 def write_body(
@@ -16,3 +20,173 @@ def write_body(
         body.write(contents)
 
     body.seek(0)
+
+
+class HttpRequestBody(io.BufferedIOBase):
+    """
+    Lazy, seekable body of incoming request. Content is read from the input only when requested
+    and never past `content_length` (when length is `None` input is read until it is exhausted).
+    Everything that was read is kept, so body can be rewound; once buffered content exceeds
+    `spool_size` it is moved to a temporary file. `stream` passes the remaining content through,
+    it is kept only when `spool_size` is set, otherwise body is consumed and cannot be read again.
+    """
+
+    def __init__(self, source: BinaryIO, content_length: Optional[int] = None, spool_size: int = 0):
+        self._source = source
+        self._remaining = content_length
+        self._buffer: BinaryIO = BytesIO()
+        self._spooled = spool_size > 0
+        if self._spooled:
+            self._buffer = SpooledTemporaryFile(max_size=spool_size)  # type: ignore
+        self._length = 0
+        self._position = 0
+        self._streamed = False
+
+    @property
+    def exhausted(self) -> bool:
+        return self._remaining == 0
+
+    @property
+    def consumed(self) -> bool:
+        return self._streamed
+
+    def _ensure_not_streamed(self) -> None:
+        if self._streamed:
+            raise io.UnsupportedOperation("Request body was consumed by `stream` and cannot be read again.")
+
+    def _fill(self, size: int) -> int:
+        if self._remaining is not None:
+            size = min(size, self._remaining)
+        if size == 0:
+            return 0
+
+        chunk = self._source.read(size)
+        if not chunk:
+            self._remaining = 0
+            return 0
+
+        if self._remaining is not None:
+            self._remaining -= len(chunk)
+        self._buffer.seek(self._length)
+        self._buffer.write(chunk)
+        self._length += len(chunk)
+
+        return len(chunk)
+
+    def _fill_to(self, position: Optional[int]) -> None:
+        self._ensure_not_streamed()
+        while not self.exhausted and (position is None or self._length < position):
+            if not self._fill(DEFAULT_CHUNK_SIZE if position is None else position - self._length):
+                break
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            self._fill_to(None)
+            offset += self._length
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2).")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}.")
+
+        self._position = offset
+        return offset
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            self._fill_to(None)
+        else:
+            self._fill_to(self._position + size)
+
+        self._buffer.seek(self._position)
+        data = self._buffer.read(-1 if size is None else size)
+        self._position += len(data)
+
+        return data
+
+    read1 = read
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+
+        return len(data)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        self._ensure_not_streamed()
+        limit = -1 if size is None else size
+        while True:
+            self._buffer.seek(self._position)
+            line = self._buffer.readline(limit)
+            if line.endswith(b"\n") or len(line) == limit or self.exhausted:
+                break
+            if not self._fill(DEFAULT_CHUNK_SIZE):
+                break
+
+        self._position += len(line)
+        return line
+
+    def getvalue(self) -> bytes:
+        self._fill_to(None)
+        self._buffer.seek(0)
+
+        return self._buffer.read()
+
+    def getbuffer(self) -> memoryview:
+        return memoryview(self.getvalue())
+
+    def stream(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yields body from the current position in chunks. Content which was not read before is
+        written only to spooled buffer, so memory usage does not depend on body's size.
+        """
+        while self._position < self._length:
+            yield self.read(min(chunk_size, self._length - self._position))
+
+        while not self.exhausted:
+            size = chunk_size if self._remaining is None else min(chunk_size, self._remaining)
+            chunk = self._source.read(size)
+            if not chunk:
+                self._remaining = 0
+                break
+            if self._remaining is not None:
+                self._remaining -= len(chunk)
+            if self._spooled:
+                self._buffer.seek(self._length)
+                self._buffer.write(chunk)
+                self._length += len(chunk)
+                self._position = self._length
+            else:
+                self._streamed = True
+            yield chunk
+
+    def close(self) -> None:
+        self._buffer.close()
+        super().close()
+
+
+RequestBody = Union[BytesIO, HttpRequestBody]
+
+
+def read_body(body: RequestBody) -> bytes:
+    """
+    Returns whole body, body consumed by `HttpRequestBody.stream` is returned as empty.
+    """
+    if isinstance(body, HttpRequestBody) and body.consumed:
+        return b""
+
+    body.seek(0)
+    return body.read()
+
+
+__all__ = ["HttpRequestBody", "RequestBody", "read_body", "write_body"]
@@ -0,0 +1,132 @@
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+CONTENT_TYPE_CACHE_SIZE = 256
+
+
+def _split_parameters(line: str) -> Iterator[str]:
+    while line[:1] == ";":
+        line = line[1:]
+        end = line.find(";")
+        # Semicolons within quoted strings are not separators
+        while end > 0 and (line.count('"', 0, end) - line.count('\\"', 0, end)) % 2:
+            end = line.find(";", end + 1)
+        if end < 0:
+            end = len(line)
+        yield line[:end].strip()
+        line = line[end:]
+
+
+def _parse_header(line: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    parts = _split_parameters(";" + line)
+    value = next(parts)
+    parameters = []
+    for part in parts:
+        index = part.find("=")
+        if index < 0:
+            continue
+        name = part[:index].strip().lower()
+        parameter = part[index + 1 :].strip()
+        if len(parameter) >= 2 and parameter[0] == parameter[-1] == '"':
+            parameter = parameter[1:-1].replace("\\\\", "\\").replace('\\"', '"')
+        parameters.append((name, parameter))
+
+    return value, tuple(parameters)
+
+
+_parse_cached_header = lru_cache(maxsize=CONTENT_TYPE_CACHE_SIZE)(_parse_header)
+
+
+def parse_header(line: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Parses header like `Content-Type` into its value and dictionary of parameters, works the same
+    as deprecated `cgi.parse_header`. Results are cached, as the same few content types are parsed
+    for most of the requests.
+    """
+    value, parameters = _parse_cached_header(line)
+
+    return value, dict(parameters)
+
+
+def parse_content_disposition(line: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Parses `Content-Disposition` header like `parse_header`, but without caching, as its values
+    (e.g. names of uploaded files) differ for each message and would evict cached content types.
+    """
+    value, parameters = _parse_header(line)
+
+    return value, dict(parameters)
+
+
+def parse_content_type(line: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Returns lowercase media type and parameters of `Content-Type` header.
+    """
+    media_type, parameters = parse_header(line)
+
+    return media_type.lower(), parameters
+
+
+@lru_cache(maxsize=CONTENT_TYPE_CACHE_SIZE)
+def parse_accept(line: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Returns media ranges of `Accept` header ordered by their quality, ranges with the same
+    quality keep the order in which client listed them.
+    """
+    media_ranges = []
+    for item in line.split(","):
+        if not item.strip():
+            continue
+        media_range, parameters = parse_header(item)
+        try:
+            quality = float(parameters.get("q", 1))
+        except ValueError:
+            quality = 0.0
+        media_ranges.append((media_range.strip().lower(), min(max(quality, 0.0), 1.0)))
+
+    return tuple(sorted(media_ranges, key=lambda media_range: -media_range[1]))
+
+
+def _specificity(media_range: str, media_type: str) -> int:
+    """
+    Returns how specifically media range matches media type, -1 when it does not match at all.
+    """
+    if media_range == media_type:
+        return 2
+    if media_range.endswith("/*") and media_type.startswith(media_range[:-1]):
+        return 1
+    if media_range in ("*/*", "*"):
+        return 0
+
+    return -1
+
+
+def negotiate_media_type(accept: str, available: Sequence[str]) -> Optional[str]:
+    """
+    Picks media type from `available` (ordered by server's preference) with the highest quality
+    in `Accept` header; quality of each type comes from the most specific range matching it.
+    Returns first available type when header is empty and `None` when none is acceptable.
+    """
+    if not accept.strip():
+        return available[0] if available else None
+
+    media_ranges = parse_accept(accept)
+    best_type = None
+    best_rank = (0.0, 0)
+    for media_type in available:
+        match = (-1, 0.0, 0)
+        for position, (media_range, quality) in enumerate(media_ranges):
+            specificity = _specificity(media_range, media_type)
+            if specificity > match[0]:
+                match = (specificity, quality, position)
+        if match[0] < 0 or match[1] <= 0:
+            continue
+        # Types with equal quality are ordered as client listed them, then by server's preference
+        rank = (match[1], -match[2])
+        if best_type is None or rank > best_rank:
+            best_type, best_rank = media_type, rank
+
+    return best_type
+
+
+__all__ = ["negotiate_media_type", "parse_accept", "parse_content_disposition", "parse_content_type", "parse_header"]
@@ -1,7 +1,14 @@
+from typing import Dict, Sequence, Union
+
+
 class HttpError(Exception):
     status_code: int = 500
     http_message = "Internal Server Error"
 
+    @property
+    def headers(self) -> Dict[str, Union[str, Sequence[str]]]:
+        return {}
+
     def __str__(self) -> str:
         return self.http_message
 
@@ -19,4 +26,22 @@ class BadRequestError(HttpError):
     http_message = "Bad Request"
 
 
-__all__ = ["HttpError", "NotFoundError", "BadRequestError"]
+class MethodNotAllowedError(HttpError):
+    status_code: int = 405
+    http_message = "Method Not Allowed"
+
+    def __init__(self, allowed_methods: Sequence[str] = (), *args):
+        super().__init__(*args)
+        self.allowed_methods = list(allowed_methods)
+
+    @property
+    def headers(self) -> Dict[str, Union[str, Sequence[str]]]:
+        return {"Allow": ", ".join(self.allowed_methods)}
+
+
+class PayloadTooLargeError(HttpError):
+    status_code: int = 413
+    http_message = "Request Entity Too Large"
+
+
+__all__ = ["HttpError", "NotFoundError", "BadRequestError", "MethodNotAllowedError", "PayloadTooLargeError"]
@@ -0,0 +1,189 @@
+import mimetypes
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import BinaryIO, Dict, Iterator, Optional, Sequence, Tuple, Union
+from urllib.parse import quote
+
+from .http_body import DEFAULT_CHUNK_SIZE
+from .http_headers import HttpHeaders
+from .http_method import HttpMethod
+from .http_request import HttpRequest
+from .http_response import StreamingHttpResponse
+from .http_status import HttpStatus
+
+_UNSATISFIABLE = (-1, -1)
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Returns `(offset, length)` of a single byte range, `None` when header should be ignored
+    (invalid or multiple ranges) and `_UNSATISFIABLE` when range is outside of the file.
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    start, separator, end = ranges.strip().partition("-")
+    if not separator:
+        return None
+    try:
+        if not start:
+            suffix = int(end)
+            if suffix <= 0:
+                return _UNSATISFIABLE
+            return max(size - suffix, 0), min(suffix, size)
+
+        first = int(start)
+        last = int(end) if end else size - 1
+    except ValueError:
+        return None
+
+    if first >= size:
+        return _UNSATISFIABLE
+    if last < first:
+        return None
+
+    last = min(last, size - 1)
+    return first, last - first + 1
+
+
+def _content_disposition(filename: str) -> str:
+    """
+    Returns `Content-Disposition` header for attachment. Control characters are dropped, so filename
+    cannot end the header, and non-ascii names are also passed as RFC 6266 `filename*` parameter.
+    """
+    filename = "".join(character for character in filename if character >= " " and character != "\x7f")
+    fallback = filename.encode("ascii", "replace").decode("ascii").replace("\\", "\\\\").replace('"', '\\"')
+    if filename.isascii():
+        return f'attachment; filename="{fallback}"'
+
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+def _not_modified_since(header: str, modified: float) -> bool:
+    try:
+        return int(modified) <= parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return False
+
+
+class FileResponse(StreamingHttpResponse):
+    """
+    Streams file from its open handle. When `request` is passed, response honours `Range`,
+    `If-Range`, `If-None-Match` and `If-Modified-Since` headers. WSGI handler passes the file
+    to `wsgi.file_wrapper` if server provides it, so it can be sent with `sendfile`.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, "os.PathLike[str]", BinaryIO],
+        request: Optional[HttpRequest] = None,
+        content_type: Optional[str] = None,
+        headers: Optional[Union[Dict[str, Union[str, Sequence[str]]], HttpHeaders]] = None,
+        filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if isinstance(file, (str, os.PathLike)):
+            path = os.fspath(file)
+            self.file: BinaryIO = open(path, "rb")
+        else:
+            path = getattr(file, "name", "")
+            self.file = file
+
+        try:
+            stat = os.fstat(self.file.fileno())
+            self.size = stat.st_size
+            self.offset = 0
+            self.length = self.size
+            self.chunk_size = chunk_size
+            self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+            if content_type is None:
+                content_type = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+
+            super().__init__(iter(()), HttpStatus.OK, headers)
+            self.headers.override("content-type", content_type)
+            self.headers.override("accept-ranges", "bytes")
+            self.headers.override("etag", self.etag)
+            self.headers.override("last-modified", self.last_modified)
+            if filename:
+                self.headers.override("content-disposition", _content_disposition(filename))
+
+            if request is not None:
+                self._apply_request_conditions(request, stat.st_mtime)
+
+            if self.status_code != HttpStatus.NOT_MODIFIED:
+                self.headers.override("content-length", str(self.length))
+            if self.length:
+                self._content = self._read_chunks()
+            else:
+                self._content = None
+                self.file.close()
+        except BaseException:
+            self.file.close()
+            raise
+
+    def _apply_request_conditions(self, request: HttpRequest, modified: float) -> None:
+        if_none_match = str(request.headers.get("if-none-match")).strip()
+        if_modified_since = str(request.headers.get("if-modified-since"))
+        if if_none_match:
+            not_modified = if_none_match == "*" or self.etag in [item.strip() for item in if_none_match.split(",")]
+        else:
+            not_modified = bool(if_modified_since) and _not_modified_since(if_modified_since, modified)
+
+        if not_modified and request.method in (HttpMethod.GET, HttpMethod.HEAD):
+            self.status_code = HttpStatus.NOT_MODIFIED
+            self.length = 0
+            return
+
+        range_header = str(request.headers.get("range"))
+        if not range_header:
+            return
+
+        if_range = str(request.headers.get("if-range"))
+        if if_range and if_range not in (self.etag, self.last_modified):
+            return
+
+        byte_range = _parse_range(range_header, self.size)
+        if byte_range is None:
+            return
+        if byte_range == _UNSATISFIABLE:
+            self.status_code = HttpStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+            self.headers.override("content-range", f"bytes */{self.size}")
+            self.length = 0
+            return
+
+        self.offset, self.length = byte_range
+        self.status_code = HttpStatus.PARTIAL_CONTENT
+        self.headers.override("content-range", f"bytes {self.offset}-{self.offset + self.length - 1}/{self.size}")
+
+    def _read_chunks(self) -> Iterator[bytes]:
+        try:
+            self.file.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = self.file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            self.file.close()
+
+    @property
+    def reaches_end_of_file(self) -> bool:
+        return self.offset + self.length == self.size
+
+    def _close_content(self) -> None:
+        content = self._content
+        super()._close_content()
+        if content is not None:
+            self.file.close()
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+
+__all__ = ["FileResponse"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generator, KeysView, Optional, Sequence, Union, ValuesView
+from typing import Generator, KeysView, List, Optional, Sequence, Tuple, Union, ValuesView
 
 
 def _normalize_header_name(name: str) -> str:
@@ -89,6 +89,12 @@ class HttpHeaders:
             for value in values:
                 yield key, value
 
+    def as_list(self) -> List[Tuple[str, str]]:
+        """
+        Returns headers as list of (name, value) pairs, ready to be passed to a server.
+        """
+        return [(key, value) for key, values in self._headers.items() for value in values]
+
     def values(self) -> ValuesView[Union[str, Sequence[str]]]:
         return self._headers.values()
 
@@ -0,0 +1,85 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Union
+
+
+class JsonCodec(ABC):
+    """
+    Serialises values to and from JSON documents encoded in utf-8. `loads` should raise
+    `ValueError` when document is invalid.
+    """
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        ...
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        ...
+
+
+class StdlibJsonCodec(JsonCodec):
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    def __init__(self) -> None:
+        try:
+            import orjson  # type: ignore
+        except ImportError:
+            raise RuntimeError("`orjson` package must be installed before using `OrjsonCodec`.")
+
+        self._orjson = orjson
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+_json_codecs: Dict[str, JsonCodec] = {"json": StdlibJsonCodec()}
+_json_codec: JsonCodec = _json_codecs["json"]
+
+
+def register_json_codec(name: str, codec: JsonCodec) -> None:
+    _json_codecs[name] = codec
+
+
+def set_json_codec(codec: Union[str, JsonCodec]) -> None:
+    """
+    Sets codec used by `JsonHttpMessage`, `JsonResponse` and `TestClient`. Codec can be passed
+    directly or by its registered name; `orjson` is registered on first use.
+    """
+    global _json_codec
+    if isinstance(codec, JsonCodec):
+        _json_codec = codec
+        return
+
+    if codec == "orjson" and codec not in _json_codecs:
+        _json_codecs[codec] = OrjsonCodec()
+    if codec not in _json_codecs:
+        raise ValueError(f"Unknown json codec `{codec}`, available codecs: {', '.join(_json_codecs)}.")
+
+    _json_codec = _json_codecs[codec]
+
+
+def get_json_codec() -> JsonCodec:
+    return _json_codec
+
+
+__all__ = [
+    "JsonCodec",
+    "OrjsonCodec",
+    "StdlibJsonCodec",
+    "get_json_codec",
+    "register_json_codec",
+    "set_json_codec",
+]
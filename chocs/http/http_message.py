@@ -1,4 +1,3 @@
-import json
 from abc import ABC
 from copy import copy
 from io import BytesIO
@@ -7,7 +6,10 @@ from typing import Any, Dict, ItemsView, KeysView, Optional, ValuesView
 
 import yaml
 
-from .http_multipart_message_parser import parse_multipart_message
+from .http_binary_codecs import cbor_loads, msgpack_loads
+from .http_body import RequestBody
+from .http_json import get_json_codec
+from .http_multipart_message_parser import parse_multipart_stream
 from .http_query_string import parse_qs
 
 
@@ -101,31 +103,63 @@ class JsonHttpMessage(CompositeHttpMessage):
     @staticmethod
     def from_bytes(body: BytesIO, encoding: str = "utf8") -> "JsonHttpMessage":
         body.seek(0)
-        decoded_input = body.read().decode(encoding)
+        data = body.read()
+        if encoding.lower().replace("-", "") != "utf8":
+            data = data.decode(encoding).encode("utf-8")
 
         parsed_body: Dict[str, Any] = {}
         try:
-            parsed_body = json.loads(decoded_input)
-        except JSONDecodeError:
+            parsed_body = get_json_codec().loads(data)
+        except ValueError:
             ...  # ignore
 
         return JsonHttpMessage(parsed_body)
 
 
+class MsgpackHttpMessage(CompositeHttpMessage):
+    @staticmethod
+    def from_bytes(body: BytesIO) -> "MsgpackHttpMessage":
+        body.seek(0)
+
+        parsed_body: Dict[str, Any] = {}
+        try:
+            parsed_body = msgpack_loads(body.read())
+        except ValueError:
+            ...  # ignore
+
+        return MsgpackHttpMessage(parsed_body)
+
+
+class CborHttpMessage(CompositeHttpMessage):
+    @staticmethod
+    def from_bytes(body: BytesIO) -> "CborHttpMessage":
+        body.seek(0)
+
+        parsed_body: Dict[str, Any] = {}
+        try:
+            parsed_body = cbor_loads(body.read())
+        except ValueError:
+            ...  # ignore
+
+        return CborHttpMessage(parsed_body)
+
+
 class MultipartHttpMessage(CompositeHttpMessage):
     @staticmethod
-    def from_bytes(body: BytesIO, boundary: str, encoding: str = "utf8") -> "MultipartHttpMessage":
+    def from_bytes(body: RequestBody, boundary: str, encoding: str = "utf8") -> "MultipartHttpMessage":
         body.seek(0)
-        fields = parse_multipart_message(body.read(), boundary, encoding)
+        fields = parse_multipart_stream(body, boundary, encoding)
 
         return MultipartHttpMessage(fields)
 
 
 __all__ = [
     "HttpMessage",
+    "CborHttpMessage",
     "CompositeHttpMessage",
     "FormHttpMessage",
     "JsonHttpMessage",
+    "MsgpackHttpMessage",
     "MultipartHttpMessage",
     "SimpleHttpMessage",
     "BinaryHttpMessage",
@@ -1,12 +1,43 @@
-from cgi import parse_header
+import shutil
 from enum import Enum
-from tempfile import TemporaryFile
-from typing import IO, Any, Dict, Tuple
+from tempfile import SpooledTemporaryFile, TemporaryFile
+from typing import IO, Any, BinaryIO, Dict, NamedTuple, Optional, Tuple, Union
+
+from .http_body import HttpRequestBody
+from .http_content_type import parse_content_disposition
+from .http_error import PayloadTooLargeError
+
+DEFAULT_SPOOL_SIZE = 1024 * 1024
+
+
+class UploadLimits(NamedTuple):
+    """
+    `spool_size` - uploaded files up to this size are kept in memory, bigger ones are moved to disk;
+        when it is `0` or lower files are written straight to disk
+    `max_part_size` - maximum size of a single part (file or field) of the message
+    `max_request_size` - maximum size of the whole message
+    """
+
+    spool_size: int = DEFAULT_SPOOL_SIZE
+    max_part_size: Optional[int] = None
+    max_request_size: Optional[int] = None
+
+
+_upload_limits = UploadLimits()
+
+
+def set_upload_limits(
+    spool_size: int = DEFAULT_SPOOL_SIZE,
+    max_part_size: Optional[int] = None,
+    max_request_size: Optional[int] = None,
+) -> None:
+    global _upload_limits
+    _upload_limits = UploadLimits(spool_size, max_part_size, max_request_size)
 
 
 class UploadedFile:
     """
-    Proxy class for TemporaryFile (uploaded file)
+    Proxy class for SpooledTemporaryFile (uploaded file)
     """
 
     def __init__(self, file: IO[Any], mimetype: str, filename: str):
@@ -30,21 +61,22 @@ class UploadedFile:
             raise ValueError(f"Cannot save to file {path} of closed stream.")
         with open(path, "wb") as file:
             self.seek(0)
-            file.write(self.read())
+            shutil.copyfileobj(self.file, file)
 
         return file
 
     def __float__(self) -> None:
-        raise ValueError(f"Cannot convert instance of {TemporaryFile.__name__} to float")
+        raise ValueError(f"Cannot convert instance of {SpooledTemporaryFile.__name__} to float")
 
     def __int__(self) -> None:
-        raise ValueError(f"Cannot convert instance of {TemporaryFile.__name__} to int")
+        raise ValueError(f"Cannot convert instance of {SpooledTemporaryFile.__name__} to int")
 
     def __len__(self) -> int:
         if not self.length:
-            read_bytes = self.read()
-            self.seek(0)
-            self.length = len(read_bytes)
+            position = self.file.tell()
+            self.file.seek(0, 2)
+            self.length = self.file.tell()
+            self.file.seek(position)
         return self.length
 
     def __bool__(self) -> bool:
@@ -68,92 +100,209 @@ class UploadedFile:
 
 
 class ParserState(Enum):
-    PART_BOUNDARY = 0
-    CONTENT_DISPOSITION = 1
-    CONTENT_TYPE = 2
-    CONTENT_HEADER = 3
-    CONTENT_DATA = 4
-    END = 5
-
-
-def parse_multipart_message(data: bytes, boundary: str, encoding: str = "utf8") -> Dict[str, Any]:
-    state = ParserState.PART_BOUNDARY
-    prev_byte = None
-    cursor = 0
-    boundary_length = len(boundary)
-    string_buffer = ""
-    body = {}
-
-    def _append_content_to_body(raw_content_disposition: str, _content_type: str, _content_data: bytes) -> None:
-        parsed_content_disposition: Tuple[str, Dict[str, str]] = parse_header(raw_content_disposition[20:])
-        if "filename" in parsed_content_disposition[1]:
-            tmp_file = TemporaryFile()
-            tmp_file.write(_content_data)
-            tmp_file.seek(0)
-            body[parsed_content_disposition[1]["name"]] = UploadedFile(
-                tmp_file,
-                _content_type[14:].lower(),
-                parsed_content_disposition[1]["filename"],
-            )
-        else:
-            # mypy bug?
-            body[parsed_content_disposition[1]["name"]] = _content_data.decode(encoding)  # type: ignore
-
-    content_disposition = ""
-    content_type = ""
-    content_cursor = 0
+    PREAMBLE = 0
+    DELIMITER = 1
+    HEADERS = 2
+    DATA = 3
+    END = 4
 
-    for code in data:
-        line_break = code == 0x0A and prev_byte == 0x0D
-        new_line_char = code == 0x0A or code == 0x0D
 
-        if not new_line_char:
-            string_buffer = string_buffer + chr(code)
+_CRLF = b"\r\n"
+_MAX_HEADERS_SIZE = 16 * 1024
+_DEFAULT_CHUNK_SIZE = 64 * 1024
 
-        if state is ParserState.PART_BOUNDARY and line_break:
-            if string_buffer == "--" + boundary:
-                string_buffer = ""
-                state = ParserState.CONTENT_DISPOSITION
-            else:
-                raise IOError("Could not parse message body, body is malformed or incorrect boundary was passed.")
 
-        elif state is ParserState.CONTENT_DISPOSITION and line_break:
-            content_disposition = string_buffer
-            string_buffer = ""
-            state = ParserState.CONTENT_TYPE
-            if data[cursor + 1 : cursor + 13].decode(encoding).lower() != "content-type":
-                state = ParserState.CONTENT_HEADER
-
-        elif state is ParserState.CONTENT_TYPE and line_break:
-            content_type = string_buffer
-            state = ParserState.CONTENT_HEADER
-            string_buffer = ""
-
-        elif state is ParserState.CONTENT_HEADER and line_break:
-            string_buffer = ""
-            state = ParserState.CONTENT_DATA
-            content_cursor = cursor
-
-        if state is ParserState.CONTENT_DATA:
-            if line_break and string_buffer == "--" + boundary:
-                content_data = data[content_cursor + 1 : cursor - (boundary_length + 5)]
-                _append_content_to_body(content_disposition, content_type, content_data)
-                content_type = ""
-                state = ParserState.CONTENT_DISPOSITION
-
-            if line_break and string_buffer == "--" + boundary + "--":
-                content_data = data[content_cursor + 1 : cursor - (boundary_length + 7)]
-                _append_content_to_body(content_disposition, content_type, content_data)
-                content_type = ""
-                state = ParserState.END
-
-            if line_break:
-                string_buffer = ""
-
-        prev_byte = code
-        cursor += 1
-
-    return body
+class MultipartParser:
+    """
+    Incremental multipart/form-data parser. Chunks passed to `feed` are searched for boundaries
+    with `bytearray.find`, content of file parts is written to their files as it arrives, so only
+    a tail shorter than the boundary is kept between chunks.
+    """
 
+    def __init__(self, boundary: str, encoding: str = "utf8", limits: Optional[UploadLimits] = None):
+        self.encoding = encoding
+        self.limits = limits if limits is not None else _upload_limits
+        self.fields: Dict[str, Any] = {}
+        self._delimiter = b"--" + boundary.encode("latin-1")
+        self._part_delimiter = _CRLF + self._delimiter
+        self._buffer = bytearray()
+        self._received = 0
+        self._part_length = 0
+        self._state = ParserState.PREAMBLE
+        self._part_name = ""
+        self._part_file: Optional[UploadedFile] = None
+        self._part_data = bytearray()
+
+    def feed(self, chunk: bytes) -> None:
+        self._received += len(chunk)
+        if self.limits.max_request_size is not None and self._received > self.limits.max_request_size:
+            self._abort()
+            raise PayloadTooLargeError()
+        self._buffer += chunk
+        while self._parse():
+            pass
+
+    def close(self) -> Dict[str, Any]:
+        if self._state is not ParserState.END and self._received:
+            raise IOError("Could not parse message body, body is malformed or incorrect boundary was passed.")
+
+        return self.fields
+
+    def _parse(self) -> bool:
+        """
+        Parses as much of the buffer as possible, returns `True` when parser moved to the next state.
+        """
+        buffer = self._buffer
+        if self._state is ParserState.DATA:
+            index = buffer.find(self._part_delimiter)
+            if index < 0:
+                # Keep the tail, it may be the beginning of split boundary
+                safe_length = len(buffer) - len(self._part_delimiter) + 1
+                if safe_length > 0:
+                    with memoryview(buffer) as view:
+                        self._write_part(view[:safe_length])
+                    del buffer[:safe_length]
+                return False
+            with memoryview(buffer) as view:
+                self._write_part(view[:index])
+            del buffer[: index + len(self._part_delimiter)]
+            self._end_part()
+            self._state = ParserState.DELIMITER
+            return True
+
+        if self._state is ParserState.PREAMBLE:
+            index = buffer.find(self._delimiter)
+            if index < 0:
+                del buffer[: max(len(buffer) - len(self._delimiter) + 1, 0)]
+                return False
+            del buffer[: index + len(self._delimiter)]
+            self._state = ParserState.DELIMITER
+            return True
+
+        if self._state is ParserState.DELIMITER:
+            if buffer[:2] == b"--":
+                self._state = ParserState.END
+                return True
+            index = buffer.find(_CRLF)
+            if index < 0:
+                if len(buffer) > _MAX_HEADERS_SIZE:
+                    raise IOError("Could not parse message body, boundary is followed by invalid data.")
+                return False
+            del buffer[: index + 2]
+            self._state = ParserState.HEADERS
+            return True
+
+        if self._state is ParserState.HEADERS:
+            if buffer[:2] == _CRLF:
+                headers_end = 0
+            else:
+                headers_end = buffer.find(_CRLF + _CRLF)
+                if headers_end < 0:
+                    if len(buffer) > _MAX_HEADERS_SIZE:
+                        raise IOError("Could not parse message body, part headers are too large.")
+                    return False
+            self._start_part(bytes(buffer[:headers_end]).decode(self.encoding))
+            del buffer[: headers_end + (2 if headers_end == 0 else 4)]
+            self._state = ParserState.DATA
+            return True
+
+        # Epilogue after closing boundary is ignored
+        buffer.clear()
+        return False
+
+    def _start_part(self, raw_headers: str) -> None:
+        headers: Dict[str, str] = {}
+        for line in raw_headers.split("\r\n"):
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        content_disposition: Tuple[str, Dict[str, str]] = parse_content_disposition(
+            headers.get("content-disposition", "")
+        )
+        self._part_name = content_disposition[1].get("name", "")
+        self._part_data = bytearray()
+        self._part_length = 0
+        self._part_file = None
+        if "filename" in content_disposition[1]:
+            # Spooled file with `max_size` of 0 would never roll over to disk
+            file: IO[Any] = (
+                SpooledTemporaryFile(max_size=self.limits.spool_size) if self.limits.spool_size > 0 else TemporaryFile()
+            )
+            self._part_file = UploadedFile(
+                file,
+                headers.get("content-type", "").lower(),
+                content_disposition[1]["filename"],
+            )
 
-__all__ = ["UploadedFile", "parse_multipart_message"]
+    def _write_part(self, data: memoryview) -> None:
+        self._part_length += len(data)
+        if self.limits.max_part_size is not None and self._part_length > self.limits.max_part_size:
+            self._abort()
+            raise PayloadTooLargeError()
+
+        if self._part_file is None:
+            self._part_data += data
+            return
+
+        self._part_file.file.write(data)
+        self._part_file.length += len(data)
+
+    def _end_part(self) -> None:
+        if self._part_file is None:
+            self.fields[self._part_name] = self._part_data.decode(self.encoding)
+            return
+
+        self._part_file.seek(0)
+        self.fields[self._part_name] = self._part_file
+
+    def _abort(self) -> None:
+        # Files of already parsed parts would be dropped with the error, release them right away
+        for field in [self._part_file, *self.fields.values()]:
+            if isinstance(field, UploadedFile):
+                field.close()
+        self.fields = {}
+        self._part_file = None
+        self._part_data = bytearray()
+        self._buffer = bytearray()
+        self._state = ParserState.END
+
+
+def parse_multipart_stream(
+    stream: Union[BinaryIO, HttpRequestBody],
+    boundary: str,
+    encoding: str = "utf8",
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    limits: Optional[UploadLimits] = None,
+) -> Dict[str, Any]:
+    """
+    Parses multipart message from the current position of the stream. Request's body is passed
+    through with `HttpRequestBody.stream`, so it is not buffered next to the parsed parts.
+    """
+    parser = MultipartParser(boundary, encoding, limits)
+    if isinstance(stream, HttpRequestBody):
+        chunks = stream.stream(chunk_size)
+    else:
+        chunks = iter(lambda: stream.read(chunk_size), b"")
+    for chunk in chunks:
+        parser.feed(chunk)
+
+    return parser.close()
+
+
+def parse_multipart_message(
+    data: bytes, boundary: str, encoding: str = "utf8", limits: Optional[UploadLimits] = None
+) -> Dict[str, Any]:
+    parser = MultipartParser(boundary, encoding, limits)
+    parser.feed(data)
+
+    return parser.close()
+
+
+__all__ = [
+    "MultipartParser",
+    "UploadLimits",
+    "UploadedFile",
+    "parse_multipart_message",
+    "parse_multipart_stream",
+    "set_upload_limits",
+]
@@ -1,24 +1,105 @@
-import json
-from cgi import parse_header
-from io import BytesIO
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Union
 
 import yaml
 
+from .http_binary_codecs import CBOR_MEDIA_TYPES, MSGPACK_MEDIA_TYPES, cbor_available, msgpack_available
+from .http_body import RequestBody, read_body
+from .http_content_type import parse_content_type
 from .http_headers import HttpHeaders
+from .http_json import get_json_codec
 from .http_message import (
+    BinaryHttpMessage,
+    CborHttpMessage,
     FormHttpMessage,
     HttpMessage,
     JsonHttpMessage,
+    MsgpackHttpMessage,
     MultipartHttpMessage,
     SimpleHttpMessage,
     YamlHttpMessage,
-    BinaryHttpMessage,
 )
 
+HttpMessageParser = Callable[[RequestBody, Dict[str, str]], Union[HttpMessage, Any]]
+
+
+def _parse_multipart_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    return MultipartHttpMessage.from_bytes(body, parameters.get("boundary", ""), parameters.get("charset", "utf8"))
+
+
+def _parse_form_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    return FormHttpMessage.from_bytes(body, parameters.get("charset", "utf8"))  # type: ignore
+
+
+def _parse_json_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    return JsonHttpMessage.from_bytes(body, parameters.get("charset", "utf8"))  # type: ignore
+
+
+def _parse_yaml_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    return YamlHttpMessage.from_bytes(body, parameters.get("charset", "utf8"))  # type: ignore
+
+
+def _parse_msgpack_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    return MsgpackHttpMessage.from_bytes(body)  # type: ignore
+
+
+def _parse_cbor_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    return CborHttpMessage.from_bytes(body)  # type: ignore
+
+
+def _parse_text_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    body.seek(0)
+    data = body.read()
+    try:
+        return SimpleHttpMessage(data.decode(parameters.get("charset", "utf8")))
+    except Exception:
+        return BinaryHttpMessage(data)
+
+
+def _parse_binary_message(body: RequestBody, parameters: Dict[str, str]) -> HttpMessage:
+    body.seek(0)
+    return BinaryHttpMessage(body.read())
+
+
+_http_message_parsers: Dict[str, HttpMessageParser] = {}
+
+
+def register_http_message_parser(media_types: Union[str, Iterable[str]], parser: HttpMessageParser) -> None:
+    """
+    Registers parser used by `parsed_body` for the given media types. Parser receives request's
+    body and parameters of `Content-Type` header. Media type can also be a wildcard like `text/*`,
+    which is used when there is no parser for the exact type.
+    """
+    if isinstance(media_types, str):
+        media_types = [media_types]
+
+    for media_type in media_types:
+        _http_message_parsers[media_type.lower()] = parser
+
+
+def get_http_message_parser(media_type: str) -> HttpMessageParser:
+    if media_type in _http_message_parsers:
+        return _http_message_parsers[media_type]
+
+    return _http_message_parsers.get(media_type.partition("/")[0] + "/*", _parse_binary_message)
+
+
+register_http_message_parser("multipart/form-data", _parse_multipart_message)
+register_http_message_parser("application/x-www-form-urlencoded", _parse_form_message)
+register_http_message_parser("application/json", _parse_json_message)
+register_http_message_parser(
+    ["text/vnd.yaml", "text/yaml", "text/x-yaml", "application/x-yaml"],
+    _parse_yaml_message,
+)
+# Without optional packages such bodies are left as binary messages
+if msgpack_available():
+    register_http_message_parser(MSGPACK_MEDIA_TYPES, _parse_msgpack_message)
+if cbor_available():
+    register_http_message_parser(CBOR_MEDIA_TYPES, _parse_cbor_message)
+register_http_message_parser("text/*", _parse_text_message)
+
 
 class HttpParsedBodyTrait:
-    _body: BytesIO
+    _body: RequestBody
     _headers: HttpHeaders
     _parsed_body: Optional[Union[HttpMessage, Any]]
     _parsed_body_getter: Optional[Callable]
@@ -27,6 +108,10 @@ class HttpParsedBodyTrait:
 
     @property
     def parsed_body(self) -> Union[HttpMessage, Any]:
+        """
+        Parses body by its content type. Multipart body is streamed into the parser; unless request
+        was created with `spool_size` it is not kept, and `as_str` returns empty string afterwards.
+        """
         if self._parsed_body:
             return self._parsed_body
 
@@ -34,59 +119,26 @@ class HttpParsedBodyTrait:
             self._parsed_body = self._parsed_body_getter()  # type: ignore
             return self._parsed_body
 
-        content_type: Tuple[str, Dict[str, str]] = parse_header(self._headers["Content-Type"])  # type: ignore
-
-        parsed_body: HttpMessage
-
-        if content_type[0] == "multipart/form-data":
-            parsed_body = MultipartHttpMessage.from_bytes(
-                self._body,
-                content_type[1].get("boundary", ""),
-                content_type[1].get("charset", "utf8"),
-            )
-        elif content_type[0] == "application/x-www-form-urlencoded":
-            parsed_body = FormHttpMessage.from_bytes(self._body, content_type[1].get("charset", "utf8"))
-
-        elif content_type[0] == "application/json":
-            parsed_body = JsonHttpMessage.from_bytes(self._body, content_type[1].get("charset", "utf8"))
-        elif content_type[0] in (
-            "text/vnd.yaml",
-            "text/yaml",
-            "text/x-yaml",
-            "application/x-yaml",
-        ):
-            parsed_body = YamlHttpMessage.from_bytes(self._body, content_type[1].get("charset", "utf8"))
-        elif content_type[0][0:4] == "text":
-            try:
-                self._body.seek(0)
-                parsed_body = SimpleHttpMessage(self._body.read().decode(content_type[1].get("charset", "utf8")))
-            except Exception:
-                self._body.seek(0)
-                parsed_body = BinaryHttpMessage(self._body.read())
-        else:
-            self._body.seek(0)
-            parsed_body = BinaryHttpMessage(self._body.read())
+        media_type, parameters = parse_content_type(self._headers["Content-Type"])  # type: ignore
+        self._parsed_body = get_http_message_parser(media_type)(self._body, parameters)
 
-        self._parsed_body = parsed_body
         return self._parsed_body
 
     def as_str(self) -> str:
         if not self._as_str:
-            self._body.seek(0)
-            self._as_str = self._body.read().decode("utf8")
+            self._as_str = read_body(self._body).decode("utf8")
 
         return self._as_str
 
     def as_dict(self) -> dict:
         if self._as_dict is None:
-            body_str = self.as_str()
             try:
-                self._as_dict = json.loads(body_str)  # type: ignore
+                self._as_dict = get_json_codec().loads(read_body(self._body))
 
                 return self._as_dict  # type: ignore
             except Exception:
                 try:
-                    self._as_dict = yaml.safe_load_all(body_str)  # type: ignore
+                    self._as_dict = yaml.safe_load_all(self.as_str())  # type: ignore
 
                     return self._as_dict  # type: ignore
                 except Exception:
@@ -4,8 +4,9 @@ from copy import copy, deepcopy
 from io import BytesIO
 from typing import Any, Dict, Optional, Union
 
-from chocs.routing import Route
-from .http_body import write_body
+from chocs.routing import RouteMatch
+
+from .http_body import HttpRequestBody, RequestBody, read_body, write_body
 from .http_cookies import HttpCookieJar, parse_cookie_header
 from .http_headers import HttpHeaders
 from .http_method import HttpMethod
@@ -18,7 +19,7 @@ class HttpRequest(HttpParsedBodyTrait):
         self,
         method: Union[HttpMethod, str],
         path: str = "/",
-        body: Union[BytesIO, bytes, bytearray, str, None] = None,
+        body: Union[HttpRequestBody, BytesIO, bytes, bytearray, str, None] = None,
         query_string: Union[Optional[HttpQueryString], str] = None,
         headers: Union[Optional[HttpHeaders], Dict[str, str]] = None,
         encoding: str = "utf-8",
@@ -36,21 +37,23 @@ class HttpRequest(HttpParsedBodyTrait):
         self.path = path
         self.query_string = query_string if query_string else HttpQueryString("")
         self.path_parameters: Dict[str, str] = {}
-        self.route: Optional[Route] = None  # type: ignore
+        self.route: Optional[RouteMatch] = None  # type: ignore
         self.attributes: Dict[str, Any] = {}
         self.encoding = encoding
         self._headers = headers if headers else HttpHeaders()
         self._cookies: Optional[HttpCookieJar] = None
-        self._body = BytesIO()
+        self._body: RequestBody = BytesIO()
         self._parsed_body = None
         self._as_dict = None
         self._as_str = None
 
-        if body:
+        if isinstance(body, HttpRequestBody):
+            self._body = body
+        elif body:
             write_body(self._body, body, encoding)
 
     @property
-    def body(self) -> BytesIO:
+    def body(self) -> RequestBody:
         return self._body
 
     @property
@@ -69,12 +72,11 @@ class HttpRequest(HttpParsedBodyTrait):
             and self._headers == other._headers
             and self.path == other.path
             and self.query_string == other.query_string
-            and self.body.getbuffer().nbytes == other.body.getbuffer().nbytes
+            and len(read_body(self._body)) == len(read_body(other._body))
         )
 
     def __str__(self) -> str:
-        self._body.seek(0)
-        return self._body.read().decode(self.encoding)
+        return read_body(self._body).decode(self.encoding)
 
     def __copy__(self) -> HttpRequest:
         new_copy = HttpRequest.__new__(HttpRequest)
@@ -83,8 +85,12 @@ class HttpRequest(HttpParsedBodyTrait):
         new_copy.query_string = deepcopy(self.query_string)
         new_copy._headers = copy(self._headers)
         new_copy._cookies = None  # reset cookies after copy
-        self._body.seek(0)
-        new_copy._body = BytesIO(self._body.read())
+        new_copy._body = BytesIO(read_body(self._body))
+        new_copy.encoding = self.encoding
+        new_copy.route = self.route
+        new_copy._parsed_body = None
+        new_copy._as_dict = None
+        new_copy._as_str = None
         new_copy.path_parameters = {key: value for key, value in self.path_parameters.items()}
         new_copy.attributes = {key: value for key, value in self.attributes.items()}
 
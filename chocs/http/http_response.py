@@ -1,10 +1,24 @@
+from abc import ABC, abstractmethod
 from io import BytesIO
-from typing import Dict, Optional, Sequence, Union
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional, Sequence, Type, Union
 
-from .http_body import write_body
+from chocs.concurrency import run_in_threadpool
+
+from .http_binary_codecs import (
+    CBOR_MEDIA_TYPES,
+    MSGPACK_MEDIA_TYPES,
+    cbor_available,
+    cbor_dumps,
+    msgpack_available,
+    msgpack_dumps,
+)
+from .http_body import DEFAULT_CHUNK_SIZE, write_body
+from .http_content_type import negotiate_media_type
 from .http_cookies import HttpCookieJar
 from .http_headers import HttpHeaders
+from .http_json import get_json_codec
 from .http_parsed_body import HttpParsedBodyTrait
+from .http_request import HttpRequest
 from .http_status import HttpStatus
 
 
@@ -78,4 +92,182 @@ class HttpResponse(HttpParsedBodyTrait):
         )
 
 
-__all__ = ["HttpResponse"]
+class SerialisedResponse(HttpResponse, ABC):
+    """
+    Base for responses which serialise `data` straight into the body, subclasses set default
+    `media_type` and implement `serialise`.
+    """
+
+    media_type: str = "application/octet-stream"
+
+    def __init__(
+        self,
+        data: Any,
+        status: Union[int, HttpStatus] = HttpStatus.OK,
+        headers: Optional[Union[Dict[str, Union[str, Sequence[str]]], HttpHeaders]] = None,
+    ):
+        headers = headers if isinstance(headers, HttpHeaders) else HttpHeaders(headers)
+        if "content-type" not in headers:
+            headers.set("content-type", self.media_type)
+
+        super().__init__(None, status, headers)
+        self._body = BytesIO(self.serialise(data))
+
+    @abstractmethod
+    def serialise(self, data: Any) -> bytes:
+        ...
+
+
+class JsonResponse(SerialisedResponse):
+    """
+    Serialises `data` with the configured json codec straight into the response body.
+    """
+
+    media_type = "application/json"
+
+    def serialise(self, data: Any) -> bytes:
+        return get_json_codec().dumps(data)
+
+
+class MsgpackResponse(SerialisedResponse):
+    media_type = MSGPACK_MEDIA_TYPES[0]
+
+    def serialise(self, data: Any) -> bytes:
+        return msgpack_dumps(data)
+
+
+class CborResponse(SerialisedResponse):
+    media_type = CBOR_MEDIA_TYPES[0]
+
+    def serialise(self, data: Any) -> bytes:
+        return cbor_dumps(data)
+
+
+def _get_negotiable_responses() -> Dict[str, Type[SerialisedResponse]]:
+    responses: Dict[str, Type[SerialisedResponse]] = {JsonResponse.media_type: JsonResponse}
+    if msgpack_available():
+        responses.update({media_type: MsgpackResponse for media_type in MSGPACK_MEDIA_TYPES})
+    if cbor_available():
+        responses.update({media_type: CborResponse for media_type in CBOR_MEDIA_TYPES})
+
+    return responses
+
+
+def negotiate_response(
+    request: HttpRequest,
+    data: Any,
+    status: Union[int, HttpStatus] = HttpStatus.OK,
+    headers: Optional[Union[Dict[str, Union[str, Sequence[str]]], HttpHeaders]] = None,
+) -> SerialisedResponse:
+    """
+    Serialises `data` to the format preferred by request's `Accept` header. JSON is always
+    available and used when client accepts none of the formats, MessagePack and CBOR are
+    available when their packages are installed.
+    """
+    responses = _get_negotiable_responses()
+    media_type = negotiate_media_type(str(request.headers.get("accept")), list(responses))
+    if media_type is None:
+        media_type = JsonResponse.media_type
+
+    headers = headers if isinstance(headers, HttpHeaders) else HttpHeaders(headers)
+    headers.override("content-type", media_type)
+    headers.set("vary", "accept")
+
+    return responses[media_type](data, status, headers)
+
+
+StreamingContent = Union[Iterable[Union[bytes, str]], AsyncIterable[Union[bytes, str]]]
+
+
+class StreamingHttpResponse(HttpResponse):
+    """
+    Response which body is produced by (async) iterable of chunks. Servers send chunks as they
+    are produced; accessing `body` reads remaining chunks into memory, which is used as a fallback
+    by adapters that cannot stream (e.g. AWS lambda).
+    """
+
+    def __init__(
+        self,
+        content: StreamingContent,
+        status: Union[int, HttpStatus] = HttpStatus.OK,
+        headers: Optional[Union[Dict[str, Union[str, Sequence[str]]], HttpHeaders]] = None,
+        encoding: str = "utf-8",
+    ):
+        self._content: Optional[StreamingContent] = None
+        super().__init__(None, status, headers, encoding)
+        self._content = content
+
+    @property  # type: ignore
+    def _body(self) -> BytesIO:  # type: ignore
+        if self._content is not None:
+            content, self._content = self._content, None
+            if hasattr(content, "__aiter__"):
+                raise RuntimeError("Asynchronous content can be read only by asynchronous iteration.")
+            for chunk in content:  # type: ignore
+                self._buffer.write(self._encode(chunk))
+            self._buffer.seek(0)
+
+        return self._buffer
+
+    @_body.setter
+    def _body(self, value: BytesIO) -> None:
+        self._close_content()
+        self._buffer = value
+
+    @property
+    def writable(self) -> bool:
+        return not self._buffer.closed
+
+    @property
+    def streaming(self) -> bool:
+        return self._content is not None
+
+    def _encode(self, chunk: Union[bytes, str]) -> bytes:
+        return chunk.encode(self.encoding) if isinstance(chunk, str) else chunk
+
+    def _close_content(self) -> None:
+        content, self._content = self._content, None
+        if hasattr(content, "close"):
+            content.close()  # type: ignore
+
+    def __iter__(self) -> Iterator[bytes]:
+        content, self._content = self._content, None
+        if content is None:
+            self._buffer.seek(0)
+            yield from iter(lambda: self._buffer.read(DEFAULT_CHUNK_SIZE), b"")
+            return
+        if hasattr(content, "__aiter__"):
+            raise RuntimeError("Asynchronous content can be read only by asynchronous iteration.")
+
+        for chunk in content:  # type: ignore
+            yield self._encode(chunk)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        content = self._content
+        if content is None or not hasattr(content, "__aiter__"):
+            # Synchronous iterables may block, so they are consumed in the thread pool
+            iterator = iter(self)
+            while True:
+                chunk = await run_in_threadpool(next, iterator, None)
+                if chunk is None:
+                    return
+                yield chunk
+
+        self._content = None
+        async for chunk in content:  # type: ignore
+            yield self._encode(chunk)
+
+    def close(self) -> None:
+        self._close_content()
+        super().close()
+
+
+__all__ = [
+    "CborResponse",
+    "HttpResponse",
+    "JsonResponse",
+    "MsgpackResponse",
+    "SerialisedResponse",
+    "StreamingHttpResponse",
+    "negotiate_response",
+]
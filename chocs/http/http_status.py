@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Union
+from typing import Dict, Union
 
 
 class HttpStatus(Enum):
@@ -101,11 +101,13 @@ class HttpStatus(Enum):
 
     @classmethod
     def from_int(cls, status: int) -> "HttpStatus":
-        value = [item for item in cls if item.value[0] == status]
-        if value:
-            return value[0]
+        try:
+            return _STATUS_CODES[status]
+        except KeyError:
+            raise ValueError(f"Invalid status value `{status}`")
 
-        raise ValueError(f"Invalid status value `{status}`")
+
+_STATUS_CODES: Dict[int, HttpStatus] = {item.value[0]: item for item in HttpStatus}
 
 
 __all__ = ["HttpStatus"]
@@ -1,5 +1,8 @@
 from .application_middleware import RequestHandlerMiddleware
 from .middleware import (
+    AsyncMiddleware,
+    AsyncMiddlewareFunction,
+    AsyncMiddlewareHandler,
     Middleware,
     MiddlewareCursor,
     MiddlewareFunction,
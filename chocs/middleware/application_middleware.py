@@ -1,15 +1,113 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+from chocs.concurrency import run_coroutine, run_in_threadpool
 from chocs.http.http_error import HttpError
 from chocs.http.http_request import HttpRequest
 from chocs.http.http_response import HttpResponse
 from chocs.routing import Router
 from chocs.serverless.serverless import ServerlessFunction
 
-from .middleware import Middleware, MiddlewareHandler
+from .middleware import (
+    AsyncMiddleware,
+    AsyncMiddlewareHandler,
+    Middleware,
+    MiddlewareHandler,
+    compile_async_middleware_chain,
+    compile_middleware_chain,
+    is_coroutine_callable,
+)
+
+
+def _unwrap_handler(handler: Callable) -> Callable[..., Any]:
+    if isinstance(handler, ServerlessFunction):
+        return handler.function
+
+    return handler
+
+
+class RequestHandler(MiddlewareHandler):
+    """
+    Ends route's middleware chain by calling route's handler.
+    """
+
+    def __init__(self, handler: Callable):
+        self.handler = _unwrap_handler(handler)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.handler(request)
+        if asyncio.iscoroutine(response):
+            return run_coroutine(response)
+
+        return response
+
+
+class AsyncRequestHandler(AsyncMiddlewareHandler):
+    """
+    Ends asynchronous middleware chain. Coroutine handlers are awaited, synchronous handlers are
+    run in the thread pool.
+    """
+
+    def __init__(self, handler: Callable):
+        self.handler = _unwrap_handler(handler)
+        self.is_coroutine = is_coroutine_callable(self.handler)
+
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_coroutine:
+            return await self.handler(request)
+
+        return await run_in_threadpool(self.handler, request)
+
+    def call_sync(self, request: HttpRequest, loop: asyncio.AbstractEventLoop) -> HttpResponse:
+        if self.is_coroutine:
+            return super().call_sync(request, loop)
+
+        return self.handler(request)
 
 
-class RequestHandlerMiddleware(Middleware):
-    def __init__(self, router: Router):
+class RouteHandler(MiddlewareHandler):
+    """
+    Route's handler together with route's middleware, compiled once for both synchronous
+    and asynchronous pipeline.
+    """
+
+    def __init__(self, handler: Callable, middleware: Sequence[Union[Middleware, AsyncMiddleware, Callable]] = ()):
+        self.handler = _unwrap_handler(handler)
+        self.middleware = tuple(middleware)
+        self._chain = compile_middleware_chain(self.middleware, RequestHandler(self.handler))
+        self.async_chain = compile_async_middleware_chain(self.middleware, as_async_handler(self.handler))
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        return self._chain(request)
+
+
+def as_async_handler(handler: Callable) -> AsyncMiddlewareHandler:
+    if isinstance(handler, RouteHandler):
+        return handler.async_chain
+    if isinstance(handler, AsyncMiddlewareHandler):
+        return handler
+
+    return AsyncRequestHandler(handler)
+
+
+class RequestHandlerMiddleware(Middleware, AsyncMiddlewareHandler):
+    """
+    Calls handler of the matched route. Used as the last middleware of synchronous pipeline, and as
+    the end of asynchronous pipeline, where route's handler and middleware can be coroutines.
+    """
+
+    def __init__(self, router: Router, async_handlers: Optional[Dict[Callable, AsyncMiddlewareHandler]] = None):
         self.router = router
+        self.async_handlers = async_handlers if async_handlers is not None else {}
+
+    def _get_async_handler(self, request: HttpRequest) -> AsyncMiddlewareHandler:
+        handler = request.attributes["__handler__"]
+        async_handler = self.async_handlers.get(handler)
+        if async_handler is None:
+            # Handlers created for the request (e.g. for 405 response) are not registered
+            async_handler = as_async_handler(handler)
+
+        return async_handler
 
     def handle(self, request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
         try:
@@ -20,10 +118,24 @@ class RequestHandlerMiddleware(Middleware):
                 response = handler.function(request)
             else:
                 response = handler(request)
+            if asyncio.iscoroutine(response):
+                return run_coroutine(response)
 
             return response
         except HttpError as error:
-            return HttpResponse(status=error.status_code, body=error.http_message)
+            return HttpResponse(status=error.status_code, body=error.http_message, headers=error.headers)
+
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        try:
+            return await self._get_async_handler(request)(request)
+        except HttpError as error:
+            return HttpResponse(status=error.status_code, body=error.http_message, headers=error.headers)
+
+    def call_sync(self, request: HttpRequest, loop: asyncio.AbstractEventLoop) -> HttpResponse:
+        try:
+            return self._get_async_handler(request).call_sync(request, loop)
+        except HttpError as error:
+            return HttpResponse(status=error.status_code, body=error.http_message, headers=error.headers)
 
 
-__all__ = ["RequestHandlerMiddleware"]
+__all__ = ["AsyncRequestHandler", "RequestHandler", "RequestHandlerMiddleware", "RouteHandler", "as_async_handler"]
@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Callable, Union, List
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Union
 
+from chocs.concurrency import run_coroutine, run_coroutine_from_thread, run_in_threadpool
 from chocs.http.http_request import HttpRequest
 from chocs.http.http_response import HttpResponse
 
@@ -20,6 +22,32 @@ class Middleware(ABC):
 MiddlewareFunction = Callable[[HttpRequest, MiddlewareHandler], HttpResponse]
 
 
+class AsyncMiddlewareHandler(ABC):
+    @abstractmethod
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        ...
+
+    def call_sync(self, request: HttpRequest, loop: asyncio.AbstractEventLoop) -> HttpResponse:
+        """
+        Passes request through the handler from a worker thread, which runs synchronous middleware.
+        Handlers that have no awaitable parts should override it to run directly in the calling thread.
+        """
+        return run_coroutine_from_thread(self(request), loop)
+
+
+class AsyncMiddleware(ABC):
+    @abstractmethod
+    async def handle(self, request: HttpRequest, next: AsyncMiddlewareHandler) -> HttpResponse:
+        ...
+
+
+AsyncMiddlewareFunction = Callable[[HttpRequest, AsyncMiddlewareHandler], Awaitable[HttpResponse]]
+
+
+def is_coroutine_callable(value: Any) -> bool:
+    return asyncio.iscoroutinefunction(value) or asyncio.iscoroutinefunction(getattr(value, "__call__", None))
+
+
 class MiddlewareCursor(MiddlewareHandler):
     def __init__(self, queue: List, parent: MiddlewareHandler):
         self.queue: List[Middleware] = [item for item in queue]
@@ -37,26 +65,207 @@ class MiddlewareCursor(MiddlewareHandler):
         return middleware(request, next)
 
 
+class MiddlewareLink(MiddlewareHandler):
+    """
+    Pre-bound element of compiled middleware chain. Calls its middleware with the next link,
+    so passing request through the chain does not copy the queue nor create any objects.
+    """
+
+    def __init__(self, queue: Sequence[Union[Middleware, AsyncMiddleware, Callable]], next: MiddlewareHandler):
+        self.queue = queue
+        self._next = next
+        middleware = queue[0]
+        self._handle: Callable[..., Any] = (
+            middleware.handle if isinstance(middleware, (Middleware, AsyncMiddleware)) else middleware
+        )
+        self._is_coroutine = is_coroutine_callable(self._handle)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._is_coroutine:
+            return run_coroutine(self._handle(request, _AsyncNext(self._next)))
+
+        return self._handle(request, self._next)
+
+
+class _AsyncNext(AsyncMiddlewareHandler):
+    """
+    Lets coroutine middleware run by synchronous pipeline await the rest of the chain, which runs
+    in the thread pool so coroutines further down the chain can get their own event loop.
+    """
+
+    def __init__(self, next: MiddlewareHandler):
+        self._next = next
+
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        return await run_in_threadpool(self._next, request)
+
+    def call_sync(self, request: HttpRequest, loop: asyncio.AbstractEventLoop) -> HttpResponse:
+        return self._next(request)
+
+
+class MiddlewareChainEnd(MiddlewareHandler):
+    def __init__(self, next: MiddlewareHandler):
+        self.queue: Sequence = ()
+        self._next = next
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        return self._next(request)
+
+
 class EmptyPipelineHandler(MiddlewareHandler):
     def __call__(self, request: HttpRequest) -> HttpResponse:
         raise RuntimeError("Middleware pipe is empty.")
 
 
+_EMPTY_PIPELINE_HANDLER = EmptyPipelineHandler()
+
+
+def compile_middleware_chain(
+    queue: Sequence[Union[Middleware, AsyncMiddleware, Callable]], next: MiddlewareHandler
+) -> MiddlewareHandler:
+    handler: MiddlewareHandler = MiddlewareChainEnd(next)
+    queue = tuple(queue)
+    for index in range(len(queue) - 1, -1, -1):
+        handler = MiddlewareLink(queue[index:], handler)
+
+    return handler
+
+
+class _SyncNext(MiddlewareHandler):
+    """
+    Lets synchronous middleware running in a worker thread call the rest of asynchronous chain.
+    """
+
+    def __init__(self, next: AsyncMiddlewareHandler, loop: asyncio.AbstractEventLoop):
+        self._next = next
+        self._loop = loop
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        return self._next.call_sync(request, self._loop)
+
+
+class AsyncMiddlewareLink(AsyncMiddlewareHandler):
+    """
+    Element of compiled asynchronous middleware chain. Coroutine middleware is awaited, synchronous
+    middleware is offloaded to the thread pool together with all synchronous middleware following it.
+    """
+
+    def __init__(self, queue: Sequence[Any], next: AsyncMiddlewareHandler):
+        self.queue = queue
+        self._next = next
+        middleware = queue[0]
+        self._middleware = middleware
+        self._async_handle: Optional[Callable[..., Any]] = None
+        self._handle: Optional[Callable[..., Any]] = None
+
+        if isinstance(middleware, (Middleware, AsyncMiddleware)):
+            if hasattr(middleware, "handle_async"):
+                self._async_handle = middleware.handle_async  # type: ignore
+            elif asyncio.iscoroutinefunction(middleware.handle):
+                self._async_handle = middleware.handle
+            else:
+                self._handle = middleware.handle
+        elif is_coroutine_callable(middleware):
+            self._async_handle = middleware
+        else:
+            self._handle = middleware
+
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._async_handle is not None:
+            return await self._async_handle(request, self._next)
+
+        return await run_in_threadpool(self.call_sync, request, asyncio.get_running_loop())
+
+    def call_sync(self, request: HttpRequest, loop: asyncio.AbstractEventLoop) -> HttpResponse:
+        if self._handle is not None:
+            return self._handle(request, _SyncNext(self._next, loop))
+        if isinstance(self._middleware, MiddlewarePipeline):
+            return self._middleware.compile_async(self._next).call_sync(request, loop)
+
+        return super().call_sync(request, loop)
+
+
+class AsyncMiddlewareChainEnd(AsyncMiddlewareHandler):
+    def __init__(self, next: AsyncMiddlewareHandler):
+        self.queue: Sequence = ()
+        self._next = next
+
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        return await self._next(request)
+
+    def call_sync(self, request: HttpRequest, loop: asyncio.AbstractEventLoop) -> HttpResponse:
+        return self._next.call_sync(request, loop)
+
+
+class AsyncEmptyPipelineHandler(AsyncMiddlewareHandler):
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        raise RuntimeError("Middleware pipe is empty.")
+
+    def call_sync(self, request: HttpRequest, loop: asyncio.AbstractEventLoop) -> HttpResponse:
+        raise RuntimeError("Middleware pipe is empty.")
+
+
+_ASYNC_EMPTY_PIPELINE_HANDLER = AsyncEmptyPipelineHandler()
+
+
+def compile_async_middleware_chain(queue: Sequence[Any], next: AsyncMiddlewareHandler) -> AsyncMiddlewareHandler:
+    handler: AsyncMiddlewareHandler = AsyncMiddlewareChainEnd(next)
+    queue = tuple(queue)
+    for index in range(len(queue) - 1, -1, -1):
+        handler = AsyncMiddlewareLink(queue[index:], handler)
+
+    return handler
+
+
 class MiddlewarePipeline(MiddlewareHandler, Middleware):
     def __init__(self, queue: List = []):
         self.queue: List = []
         if queue:
             self.queue = [item for item in queue]
+        self._chain: Optional[Tuple[MiddlewareHandler, MiddlewareHandler]] = None
+        self._async_chain: Optional[Tuple[AsyncMiddlewareHandler, AsyncMiddlewareHandler]] = None
 
-    def append(self, *middleware: Union[Middleware, Callable]) -> None:
+    def append(self, *middleware: Union[Middleware, AsyncMiddleware, Callable]) -> None:
         for item in middleware:
             self.queue.append(item)
+        self._chain = None
+        self._async_chain = None
+
+    def compile(self, next: MiddlewareHandler = _EMPTY_PIPELINE_HANDLER) -> MiddlewareHandler:
+        """
+        Turns the queue into chain of pre-bound handlers ending with `next` handler. Chain is kept
+        for subsequent requests and rebuilt when middleware is appended or pipeline is used with
+        different `next` handler.
+        """
+        chain = self._chain
+        if chain is None or chain[0] is not next:
+            chain = (next, compile_middleware_chain(self.queue, next))
+            self._chain = chain
+
+        return chain[1]
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        return self.handle(request, EmptyPipelineHandler())
+        return self.compile(_EMPTY_PIPELINE_HANDLER)(request)
 
     def handle(self, request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
-        return (MiddlewareCursor(self.queue, next)).__call__(request)
+        return self.compile(next)(request)
+
+    def compile_async(self, next: AsyncMiddlewareHandler = _ASYNC_EMPTY_PIPELINE_HANDLER) -> AsyncMiddlewareHandler:
+        """
+        Asynchronous counterpart of `compile`, queue may mix coroutine and synchronous middleware.
+        """
+        chain = self._async_chain
+        if chain is None or chain[0] is not next:
+            chain = (next, compile_async_middleware_chain(self.queue, next))
+            self._async_chain = chain
+
+        return chain[1]
+
+    async def call_async(self, request: HttpRequest) -> HttpResponse:
+        return await self.compile_async(_ASYNC_EMPTY_PIPELINE_HANDLER)(request)
+
+    async def handle_async(self, request: HttpRequest, next: AsyncMiddlewareHandler) -> HttpResponse:
+        return await self.compile_async(next)(request)
 
     @property
     def empty(self) -> bool:
@@ -64,9 +273,19 @@ class MiddlewarePipeline(MiddlewareHandler, Middleware):
 
 
 __all__ = [
+    "AsyncMiddleware",
+    "AsyncMiddlewareChainEnd",
+    "AsyncMiddlewareFunction",
+    "AsyncMiddlewareHandler",
+    "AsyncMiddlewareLink",
     "MiddlewareHandler",
     "Middleware",
     "MiddlewareFunction",
     "MiddlewareCursor",
+    "MiddlewareLink",
+    "MiddlewareChainEnd",
     "MiddlewarePipeline",
+    "compile_async_middleware_chain",
+    "compile_middleware_chain",
+    "is_coroutine_callable",
 ]
@@ -28,16 +28,16 @@ class QueryCriteria:
     def values(self):
         return self._fields.values()
 
-    def next_query(self, cursor: str = "") -> str:
+    def next_query(self, cursor: str = "", uri: str = "") -> str:
         query = [self._base_str]
         if cursor:
             query.append(f"cursor={cursor}")
         else:
             query.append(f"offset={self.offset + self.limit}")
 
-        return "&".join(query)
+        return _with_uri(uri, "&".join(query))
 
-    def prev_query(self, cursor: str = "") -> str:
+    def prev_query(self, cursor: str = "", uri: str = "") -> str:
         query = [self._base_str]
         if cursor:
             query.append(f"cursor={cursor}")
@@ -46,7 +46,7 @@ class QueryCriteria:
         else:
             query.append("offset=0")
 
-        return "&".join(query)
+        return _with_uri(uri, "&".join(query))
 
     def __contains__(self, name: str) -> bool:
         return self._fields.__contains__(name)
@@ -84,6 +84,13 @@ class QueryCriteria:
         return self.__str__()
 
 
+def _with_uri(uri: str, query: str) -> str:
+    if not uri:
+        return query
+
+    return uri + ("&" if "?" in uri else "?") + query
+
+
 def create_criteria_fields(query: Dict[str, Any], allowed_fields: List[str] = None) -> Dict[str, Expression]:
     result = {}
 
@@ -1,15 +1,77 @@
 from __future__ import annotations
 
 import re
+from bisect import insort
+from collections import OrderedDict
 from copy import copy
-from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union, Literal, overload
-
-from chocs.http.http_error import NotFoundError
+from enum import Enum
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import quote, unquote, urlencode
+from uuid import UUID
+
+from chocs.http.http_error import HttpError, MethodNotAllowedError, NotFoundError
 from chocs.http.http_method import HttpMethod
 from chocs.http.http_query_string import parse_qs_value
 
-_ROUTE_REGEX = r"\\\{\s*(?P<var>[a-z_][a-z0-9_-]*)\s*\\\}"
 _VAR_REGEX = "[^/]+"
+_VAR_NAME_REGEX = re.compile(r"\{\s*(?P<var>[a-z_][a-z0-9_-]*)\s*(?::\s*(?P<converter>[a-z_][a-z0-9_]*)\s*)?\}")
+_SEGMENT_VAR_REGEX = re.compile(r"^\{\s*(?P<var>[a-z_][a-z0-9_-]*)\s*(?::\s*(?P<converter>[a-z_][a-z0-9_]*)\s*)?\}$")
+
+
+class RouteConverter:
+    """
+    Converter of typed route parameter, e.g. `{id:int}`. Pattern is compiled into route's pattern and
+    cast function is called once for the captured value. Pattern must not contain capturing groups.
+    Converters spanning segments (like `path`) may match `/` characters.
+    """
+
+    __slots__ = ["pattern", "cast", "spans_segments", "regex"]
+
+    def __init__(self, pattern: str, cast: Callable[[str], Any], spans_segments: bool = False):
+        self.pattern = pattern
+        self.cast = cast
+        self.spans_segments = spans_segments
+        self.regex: Pattern[str] = re.compile(pattern, re.I)
+
+
+_CONVERTERS: Dict[str, RouteConverter] = {
+    "str": RouteConverter("[^/]+", unquote),
+    "int": RouteConverter(r"-?\d+", int),
+    "float": RouteConverter(r"-?\d+(?:\.\d+)?", float),
+    "uuid": RouteConverter(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", UUID),
+    "path": RouteConverter(".+", unquote, spans_segments=True),
+}
+
+
+def register_converter(name: str, pattern: str, cast: Callable[[str], Any], spans_segments: bool = False) -> None:
+    _CONVERTERS[name] = RouteConverter(pattern, cast, spans_segments)
+
+
+def _get_converter(name: str) -> RouteConverter:
+    if name not in _CONVERTERS:
+        raise ValueError(f"Unknown route parameter converter `{name}`")
+
+    return _CONVERTERS[name]
+
+
+def _escape_route(route: str) -> str:
+    return re.escape(route).replace(r"\*", ".*?")
 
 
 class Route:
@@ -17,18 +79,34 @@ class Route:
         "route",
         "attributes",
         "_parameters_names",
+        "_parameters_casts",
+        "_template",
         "_pattern",
         "_parameters",
         "is_wildcard",
+        "is_static",
     ]
 
     def __init__(self, route: str, attributes: Optional[Dict] = None):
         self.route = route
         self.attributes = attributes if attributes is not None else {}
         self._parameters_names: List[str] = []
+        self._parameters_casts: List[Callable[[str], Any]] = []
+        # literal parts and (name, safe characters) pairs used to build uri out of the route
+        self._template: List[Union[str, Tuple[str, str]]] = []
+        position = 0
+        for var in _VAR_NAME_REGEX.finditer(route):
+            self._parameters_names.append(var.group("var"))
+            converter = var.group("converter")
+            self._parameters_casts.append(_get_converter(converter).cast if converter else parse_qs_value)
+            self._template.append(route[position : var.start()])
+            self._template.append((var.group("var"), "/" if converter == "path" else ""))
+            position = var.end()
+        self._template.append(route[position:])
         self._pattern: Pattern[str] = None  # type: ignore
         self._parameters: Dict[str, str] = {}
         self.is_wildcard: bool = "*" in route
+        self.is_static: bool = not self.is_wildcard and "{" not in route and "}" not in route
 
     @property
     def pattern(self) -> Pattern[str]:
@@ -37,14 +115,15 @@ class Route:
         return self._pattern
 
     def _parse(self) -> None:
-        def _parse_var(match):
-            param = match.group(1)
-            self._parameters_names.append(param)
-            return f"({_VAR_REGEX})"
-
-        pattern = re.escape(self.route)
-        pattern = re.sub(_ROUTE_REGEX, _parse_var, pattern, re.I | re.M)
-        pattern = re.sub(r"\\\*", ".*?", pattern)
+        pattern = ""
+        position = 0
+        for var in _VAR_NAME_REGEX.finditer(self.route):
+            converter = var.group("converter")
+            pattern += _escape_route(self.route[position : var.start()])
+            pattern += f"({_get_converter(converter).pattern if converter else _VAR_REGEX})"
+            position = var.end()
+        pattern += _escape_route(self.route[position:])
+
         self._pattern = re.compile(
             "^" + pattern + "$",
             re.I | re.M,
@@ -62,14 +141,36 @@ class Route:
             matches = list(matches[0])
 
         route = copy(self)
-        match_index = 0
-        route._parameters = {}
-        for value in matches:
-            route._parameters[self._parameters_names[match_index]] = parse_qs_value(value)
-            match_index += 1
+        route._parameters = self._parse_parameters(matches)
 
         return route
 
+    def build(self, parameters: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Builds uri out of the route by substituting route's variables with passed parameters.
+        """
+        if self.is_wildcard:
+            raise ValueError(f"Cannot build uri for wildcard route `{self.route}`")
+
+        if not self._parameters_names:
+            return self.route
+
+        parameters = parameters if parameters is not None else {}
+        uri = []
+        for part in self._template:
+            if isinstance(part, str):
+                uri.append(part)
+                continue
+            name, safe = part
+            if name not in parameters:
+                raise ValueError(f"Missing parameter `{name}` required by route `{self.route}`")
+            uri.append(quote(str(parameters[name]), safe=safe))
+
+        return "".join(uri)
+
+    def _parse_parameters(self, values: Sequence[str]) -> Dict[str, Any]:
+        return {name: cast(value) for name, cast, value in zip(self._parameters_names, self._parameters_casts, values)}
+
     @property
     def parameters(self):
         return self._parameters
@@ -87,6 +188,9 @@ class Route:
         return key in self._parameters
 
     def __eq__(self, other):
+        if isinstance(other, RouteMatch):
+            other = other.definition
+
         if not isinstance(other, Route):
             raise TypeError(f"Passed parameter was {type(other)}, instead of Route")
 
@@ -102,58 +206,622 @@ class Route:
         new_copy = Route.__new__(Route)
         new_copy.route = self.route
         new_copy._parameters_names = self._parameters_names
+        new_copy._parameters_casts = self._parameters_casts
+        new_copy._template = self._template
         new_copy._pattern = self._pattern
         new_copy._parameters = {key: value for key, value in self._parameters.items()}
         new_copy.is_wildcard = self.is_wildcard
+        new_copy.is_static = self.is_static
         new_copy.attributes = {key: value for key, value in self.attributes.items()}
 
         return new_copy
 
 
-class Router:
+class RouteMatch:
+    """
+    Result of matching uri against a route. Keeps a reference to the matched route
+    definition and parameters captured from the uri, so route is not copied per request.
+    """
+
+    __slots__ = ["definition", "parameters"]
+
+    def __init__(self, definition: Route, parameters: Optional[Dict[str, Any]] = None):
+        self.definition = definition
+        self.parameters = parameters if parameters is not None else {}
+
+    @property
+    def route(self) -> str:
+        return self.definition.route
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self.definition.attributes
+
+    @property
+    def is_wildcard(self) -> bool:
+        return self.definition.is_wildcard
+
+    def __str__(self) -> str:
+        return self.definition.route
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __getitem__(self, key: str) -> Any:
+        return self.parameters[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.parameters
+
+    def __eq__(self, other):
+        if isinstance(other, RouteMatch):
+            return self.definition == other.definition and self.parameters == other.parameters
+
+        return self.definition == other
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        return self.parameters.get(key, default)
+
+    def __copy__(self) -> RouteMatch:
+        return RouteMatch(self.definition, {key: value for key, value in self.parameters.items()})
+
+
+_RouteEntry = Tuple[Tuple[bool, int], Route, Callable]
+_EngineMatch = Tuple[Route, Callable, Sequence[str]]
+
+
+class RouterEngine(Enum):
+    TREE = "tree"
+    REGEX = "regex"
+    LINEAR = "linear"
+
+
+class _RouteNode:
+    __slots__ = ["static", "variables", "wildcard", "patterns", "routes"]
+
     def __init__(self):
-        self._routes: Dict[HttpMethod, List[Tuple[Route, Callable]]] = {}
+        self.static: Dict[str, _RouteNode] = {}
+        # keyed by converter's name, untyped variables are kept under empty name
+        self.variables: Dict[str, _RouteNode] = {}
+        self.wildcard: List[_RouteEntry] = []
+        self.patterns: List[_RouteEntry] = []
+        self.routes: List[_RouteEntry] = []
+
+
+class _RouteTree:
+    """
+    Segment based route tree. Static segments are resolved with dictionary lookups, `{var}` segments
+    are captured and trailing `*` segments match the rest of the uri. Segments which cannot be
+    expressed in the tree (e.g. `/files/{name}.json`) are matched with route's pattern at the node
+    where tree gives up, so lookup cost depends on the uri depth rather than number of routes.
+
+    Routes keep the same priority as in the linear scan: routes without wildcards first,
+    then in the order they were appended.
+    """
+
+    def __init__(self):
+        self._root = _RouteNode()
+        self._size = 0
+
+    def append(self, route: Route, handler: Callable) -> None:
+        self._size += 1
+        entry: _RouteEntry = ((route.is_wildcard, self._size), route, handler)
+        segments = route.route.split("/")
+        last_index = len(segments) - 1
+        node = self._root
+
+        for index, segment in enumerate(segments):
+            if segment == "*" and index == last_index:
+                node.wildcard.append(entry)
+                return
+
+            var = _SEGMENT_VAR_REGEX.match(segment)
+            if var and not (var.group("converter") and _get_converter(var.group("converter")).spans_segments):
+                converter = var.group("converter") or ""
+                if converter not in node.variables:
+                    node.variables[converter] = _RouteNode()
+                node = node.variables[converter]
+                continue
+
+            if "*" in segment or "{" in segment or "}" in segment:
+                insort(node.patterns, entry)
+                return
+
+            lower_segment = segment.lower()
+            if lower_segment not in node.static:
+                node.static[lower_segment] = _RouteNode()
+            node = node.static[lower_segment]
+
+        node.routes.append(entry)
+
+    def compile(self) -> None:
+        """
+        Tree is built as routes are appended, compiling only parses patterns of the routes,
+        so the first request matching them does not pay for it.
+        """
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            for _, route, _ in node.routes + node.wildcard + node.patterns:
+                if not route._pattern:
+                    route._parse()
+            nodes.extend(node.static.values())
+            nodes.extend(node.variables.values())
+
+    def match(self, uri: str) -> Optional[_EngineMatch]:
+        best = self._search(self._root, uri, uri.split("/"), uri.lower().split("/"), 0, [], None)
+        if best is None:
+            return None
+
+        return best[0][1], best[0][2], best[1]
+
+    def _search(
+        self,
+        node: _RouteNode,
+        uri: str,
+        segments: List[str],
+        lower_segments: List[str],
+        index: int,
+        values: List[str],
+        best: Optional[Tuple[_RouteEntry, Sequence[str]]],
+    ) -> Optional[Tuple[_RouteEntry, Sequence[str]]]:
+        if index == len(segments):
+            if node.routes and (best is None or node.routes[0][0] < best[0][0]):
+                best = node.routes[0], list(values)
+        else:
+            child = node.static.get(lower_segments[index])
+            if child is not None:
+                best = self._search(child, uri, segments, lower_segments, index + 1, values, best)
+
+            segment = segments[index]
+            if node.variables and segment:
+                values.append(segment)
+                for converter, variable_node in node.variables.items():
+                    if converter and not _CONVERTERS[converter].regex.fullmatch(segment):
+                        continue
+                    best = self._search(variable_node, uri, segments, lower_segments, index + 1, values, best)
+                values.pop()
+
+            if node.wildcard and (best is None or node.wildcard[0][0] < best[0][0]):
+                best = node.wildcard[0], list(values)
+
+        for entry in node.patterns:
+            if best is not None and best[0][0] < entry[0]:
+                break
+            match = entry[1].pattern.match(uri)
+            if match:
+                best = entry, match.groups()
+                break
+
+        return best
+
+    def match_all(self, uri: str) -> List[Callable]:
+        found: List[Callable] = []
+        self._collect(self._root, uri, uri.split("/"), uri.lower().split("/"), 0, found)
+
+        return found
+
+    def _collect(
+        self,
+        node: _RouteNode,
+        uri: str,
+        segments: List[str],
+        lower_segments: List[str],
+        index: int,
+        found: List[Callable],
+    ) -> None:
+        if index == len(segments):
+            found.extend(entry[2] for entry in node.routes)
+        else:
+            child = node.static.get(lower_segments[index])
+            if child is not None:
+                self._collect(child, uri, segments, lower_segments, index + 1, found)
+
+            segment = segments[index]
+            if segment:
+                for converter, variable_node in node.variables.items():
+                    if converter and not _CONVERTERS[converter].regex.fullmatch(segment):
+                        continue
+                    self._collect(variable_node, uri, segments, lower_segments, index + 1, found)
+
+            found.extend(entry[2] for entry in node.wildcard)
+
+        found.extend(entry[2] for entry in node.patterns if entry[1].pattern.match(uri))
+
+
+class _RouteRegex:
+    """
+    Compiles all routes into a single alternation pattern, where each route is represented by
+    uniquely named group. Routes without wildcards come first, so one `re.match` call finds the same
+    route as the linear scan would.
+    """
+
+    def __init__(self):
+        self._routes: List[Tuple[Route, Callable]] = []
+        self._groups: Dict[int, Tuple[Route, Callable, Tuple[int, ...]]] = {}
+        self._pattern: Optional[Pattern[str]] = None
+
+    def append(self, route: Route, handler: Callable) -> None:
+        self._routes.append((route, handler))
+        self._pattern = None
+
+    def compile(self) -> None:
+        if self._pattern is None:
+            self._pattern = self._compile()
+
+    def _compile(self) -> Pattern[str]:
+        self._routes.sort(key=lambda r: r[0].is_wildcard)
+        self._groups = {}
+        alternatives = []
+        group_index = 1
+        for index, (route, handler) in enumerate(self._routes):
+            source = route.pattern.pattern[1:-1]
+            alternatives.append(f"(?P<route_{index}>{source})")
+            parameters_count = route.pattern.groups
+            self._groups[group_index] = (
+                route,
+                handler,
+                tuple(range(group_index + 1, group_index + 1 + parameters_count)),
+            )
+            group_index += parameters_count + 1
+
+        return re.compile("^(?:" + "|".join(alternatives) + ")$", re.I | re.M)
+
+    def match(self, uri: str) -> Optional[_EngineMatch]:
+        if self._pattern is None:
+            self._pattern = self._compile()
+
+        match = self._pattern.match(uri)
+        if not match:
+            return None
+
+        route, handler, groups = self._groups[match.lastindex]  # type: ignore
+        if not groups:
+            return route, handler, ()
+        if len(groups) == 1:
+            return route, handler, (match.group(groups[0]),)
+
+        return route, handler, match.group(*groups)
+
+
+class _RouteList:
+    """
+    Tries every route's pattern in order, routes without wildcards first.
+    """
+
+    def __init__(self):
+        self._routes: List[Tuple[Route, Callable]] = []
+        self._sorted = True
+
+    def append(self, route: Route, handler: Callable) -> None:
+        self._routes.append((route, handler))
+        self._sorted = False
+
+    def compile(self) -> None:
+        if not self._sorted:
+            self._routes.sort(key=lambda r: r[0].is_wildcard)
+            self._sorted = True
+        for route, _ in self._routes:
+            if not route._pattern:
+                route._parse()
+
+    def match(self, uri: str) -> Optional[_EngineMatch]:
+        if not self._sorted:
+            self.compile()
+
+        for route, handler in self._routes:
+            match = route.pattern.match(uri)
+            if match:
+                return route, handler, match.groups()
+
+        return None
+
+
+_RouteEngine = Union[_RouteTree, _RouteRegex, _RouteList]
+
+_ENGINES: Dict[RouterEngine, Type[_RouteEngine]] = {
+    RouterEngine.TREE: _RouteTree,
+    RouterEngine.REGEX: _RouteRegex,
+    RouterEngine.LINEAR: _RouteList,
+}
+
+
+class RouteCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _RouteCache:
+    """
+    Bounded LRU cache of resolved routes keyed by (method, uri). Keeps parsed parameters,
+    so cache hits do not have to run route's pattern nor parse captured values again.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Tuple[HttpMethod, str]) -> Optional[Tuple[Route, Callable, Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry
+
+    def set(self, key: Tuple[HttpMethod, str], entry: Tuple[Route, Callable, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> RouteCacheInfo:
+        return RouteCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+
+def _normalise_host(host: str) -> str:
+    host = host.lower()
+    if host.startswith("["):  # ipv6
+        return host[: host.find("]") + 1]
+
+    return host.split(":", 1)[0]
+
+
+def _compile_host_pattern(host: str) -> Tuple[Pattern[str], List[str]]:
+    pattern = ""
+    names = []
+    position = 0
+    for var in _VAR_NAME_REGEX.finditer(host):
+        names.append(var.group("var"))
+        pattern += _escape_route(host[position : var.start()])
+        pattern += "([^.]+)"
+        position = var.end()
+    pattern += _escape_route(host[position:])
+
+    return re.compile("^" + pattern + "$", re.I), names
+
+
+class Router:
+    def __init__(self, engine: RouterEngine = RouterEngine.TREE, cache_size: int = 0):
+        self.engine = engine
+        self.cache_size = cache_size
+        self.host_routing = False
+        self._hosts: Dict[str, Router] = {}
+        self._host_patterns: List[Tuple[Pattern[str], List[str], Router]] = []
+        self._named_routes: Dict[str, Route] = {}
+        self._engines: Dict[HttpMethod, _RouteEngine] = {}
+        # static routes and the path index are keyed by lower-cased route, as routes are case-insensitive
+        self._static_routes: Dict[str, Dict[HttpMethod, Tuple[Route, Callable]]] = {}
+        self._paths: Dict[str, List[HttpMethod]] = {}
+        self._paths_tree = _RouteTree()
+        self._cache: Optional[_RouteCache] = _RouteCache(cache_size) if cache_size > 0 else None
 
     def append(
         self,
         route: Route,
         handler: Callable,
-        methods: Union[str, HttpMethod, List[Union[str, HttpMethod]]] = HttpMethod.GET,
+        methods: Union[str, HttpMethod, Sequence[Union[str, HttpMethod]]] = HttpMethod.GET,
+        host: Optional[str] = None,
     ) -> None:
         assert isinstance(route, Route), "Passed route must be instance of Route"
+        if "name" in route.attributes:
+            self._named_routes.setdefault(route.attributes["name"], route)
+
+        if host is not None:
+            self._get_host_router(host).append(route, handler, methods)
+            return
+
         normalised_methods = self._normalise_methods(methods)
 
-        for method in normalised_methods:
-            if method not in self._routes:
-                self._routes[method] = []
+        path = route.route.lower()
+        if route.is_static and path not in self._static_routes:
+            self._static_routes[path] = {}
+        if path not in self._paths:
+            self._paths[path] = []
+            if not route.is_static:
+                # allowed methods are shared with the tree, so the path is inserted only once
+                self._paths_tree.append(route, self._paths[path])  # type: ignore
 
-            self._routes[method].append((route, handler))
-            self._routes[method].sort(key=lambda r: r[0].is_wildcard)
+        for method in normalised_methods:
+            if method not in self._engines:
+                self._engines[method] = _ENGINES[self.engine]()
+
+            if method not in self._paths[path]:
+                self._paths[path].append(method)
+            if route.is_static:
+                self._static_routes[path].setdefault(method, (route, handler))
+            else:
+                self._engines[method].append(route, handler)
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _get_host_router(self, host: str) -> Router:
+        self.host_routing = True
+        if "{" not in host and "*" not in host:
+            host = _normalise_host(host)
+            if host not in self._hosts:
+                self._hosts[host] = Router(self.engine, self.cache_size)
+            return self._hosts[host]
+
+        pattern, names = _compile_host_pattern(host)
+        for host_pattern, _, host_router in self._host_patterns:
+            if host_pattern.pattern == pattern.pattern:
+                return host_router
+
+        host_router = Router(self.engine, self.cache_size)
+        self._host_patterns.append((pattern, names, host_router))
+
+        return host_router
+
+    def extend(
+        self,
+        routes: Iterable[Tuple[Route, Callable, Union[str, HttpMethod, Sequence[Union[str, HttpMethod]]]]],
+    ) -> None:
+        for route, handler, methods in routes:
+            self.append(route, handler, methods)
+
+    def freeze(self) -> None:
+        """
+        Prepares router for handling requests: compiles all route patterns and matching engines,
+        so this work is done once at startup instead of during the first requests. Routes can still
+        be appended afterwards, engines are then rebuilt lazily.
+        """
+        for static_routes in self._static_routes.values():
+            for route, _ in static_routes.values():
+                if not route._pattern:
+                    route._parse()
+        for engine in self._engines.values():
+            engine.compile()
+
+        for host_router in self._hosts.values():
+            host_router.freeze()
+        for _, _, host_router in self._host_patterns:
+            host_router.freeze()
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def url_for(self, name: str, **parameters: Any) -> str:
+        """
+        Builds uri for the route registered with given name. Parameters which are not used
+        by the route are appended to the uri as query string.
+        """
+        if name not in self._named_routes:
+            raise KeyError(f"There is no route named `{name}`")
+
+        route = self._named_routes[name]
+        uri = route.build(parameters)
+        query = {key: value for key, value in parameters.items() if key not in route._parameters_names}
+        if query:
+            uri += "?" + urlencode(query, doseq=True)
+
+        return uri
+
+    def cache_info(self) -> Optional[RouteCacheInfo]:
+        if self._cache is None:
+            return None
+
+        return self._cache.info()
 
     @staticmethod
-    def _normalise_methods(methods: Union[str, HttpMethod, List[Union[str, HttpMethod]]]) -> List[HttpMethod]:
+    def _normalise_methods(methods: Union[str, HttpMethod, Sequence[Union[str, HttpMethod]]]) -> List[HttpMethod]:
         if methods == "*":
             methods = list(HttpMethod)
         elif isinstance(methods, HttpMethod):
             methods = [methods]
+        elif isinstance(methods, str):
+            methods = [HttpMethod(methods.upper())]
         else:
             methods = [method if isinstance(method, HttpMethod) else HttpMethod(method.upper()) for method in methods]
 
         return methods  # type: ignore
 
-    def match(self, uri: str, method: Union[HttpMethod, str] = HttpMethod.GET) -> Tuple[Route, Callable]:
+    def match(
+        self,
+        uri: str,
+        method: Union[HttpMethod, str] = HttpMethod.GET,
+        host: Optional[str] = None,
+    ) -> Tuple[RouteMatch, Callable]:
         if isinstance(method, str):
             method = HttpMethod(method)
 
-        if method not in self._routes:
-            raise NotFoundError(f"Could not match any resource matching {method} {uri} uri")
+        if not host or not self.host_routing:
+            return self._match(uri, method)
 
-        for route in self._routes[method]:
-            match = route[0].match(uri)
+        host_router, host_parameters = self._match_host(host)
+        if host_router is None:
+            return self._match(uri, method)
+
+        try:
+            route, handler = host_router._match(uri, method)
+            route.parameters.update(host_parameters)
+
+            return route, handler
+        except (NotFoundError, MethodNotAllowedError) as error:
+            host_error = error
+
+        # routes registered without host are shared by all the hosts
+        try:
+            return self._match(uri, method)
+        except NotFoundError:
+            raise host_error
+
+    def _match_host(self, host: str) -> Tuple[Optional[Router], Dict[str, str]]:
+        host = _normalise_host(host)
+        if host in self._hosts:
+            return self._hosts[host], {}
+
+        for host_pattern, names, host_router in self._host_patterns:
+            match = host_pattern.match(host)
             if match:
-                return match, route[1]
+                return host_router, dict(zip(names, match.groups()))
+
+        return None, {}
+
+    def _match(self, uri: str, method: HttpMethod) -> Tuple[RouteMatch, Callable]:
+        static_routes = self._static_routes.get(uri.lower())
+        if static_routes is not None and method in static_routes:
+            route, handler = static_routes[method]
+            return RouteMatch(route), handler
+
+        if method not in self._engines:
+            raise self._create_match_error(uri, method)
+
+        if self._cache is not None:
+            cached = self._cache.get((method, uri))
+            if cached is not None:
+                return RouteMatch(cached[0], {key: value for key, value in cached[2].items()}), cached[1]
+
+        match = self._engines[method].match(uri)
+        if match is None:
+            raise self._create_match_error(uri, method)
+
+        route, handler, values = match
+        parameters = route._parse_parameters(values)
+        if self._cache is not None:
+            self._cache.set((method, uri), (route, handler, parameters))
+            parameters = {key: value for key, value in parameters.items()}
+
+        return RouteMatch(route, parameters), handler
+
+    def allowed_methods(self, uri: str) -> List[HttpMethod]:
+        """
+        Returns all methods registered for routes matching given uri, regardless of request's method.
+        """
+        methods: Set[HttpMethod] = set()
+        static_routes = self._static_routes.get(uri.lower())
+        if static_routes is not None:
+            methods.update(static_routes.keys())
+        for path_methods in self._paths_tree.match_all(uri):
+            methods.update(path_methods)  # type: ignore
+
+        return [method for method in HttpMethod if method in methods]
+
+    def _create_match_error(self, uri: str, method: HttpMethod) -> HttpError:
+        allowed_methods = self.allowed_methods(uri)
+        if allowed_methods:
+            return MethodNotAllowedError(
+                [str(allowed_method) for allowed_method in allowed_methods],
+                f"Method {method} is not allowed for {uri} uri",
+            )
 
-        raise NotFoundError(f"Could not match any resource matching {method} {uri} uri")
+        return NotFoundError(f"Could not match any resource matching {method} {uri} uri")
 
 
-__all__ = ["Route", "Router"]
+__all__ = ["Route", "RouteCacheInfo", "RouteConverter", "RouteMatch", "Router", "RouterEngine", "register_converter"]
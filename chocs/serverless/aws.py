@@ -1,18 +1,18 @@
 import base64
-from cgi import parse_header
-from copy import copy
 from io import BytesIO
 from typing import Any, Dict
 from urllib.parse import quote_plus
 
+from chocs.http.http_content_type import parse_header
 from chocs.http.http_headers import HttpHeaders
 from chocs.http.http_query_string import HttpQueryString
 from chocs.http.http_request import HttpRequest
 from chocs.http.http_response import HttpResponse
 from chocs.http.http_status import HttpStatus
 from chocs.middleware.middleware import MiddlewareHandler, MiddlewarePipeline
-from chocs.routing import Route
+from chocs.routing import Route, RouteMatch
 from chocs.types import HttpHandlerFunction
+
 from .serverless import ServerlessFunction
 
 TEXT_MIME_TYPES = [
@@ -58,9 +58,7 @@ class AwsServerlessFunction(ServerlessFunction):
                 "statusCode": int(HttpStatus.CONTINUE),
             }
         request = create_http_request_from_aws_event(event, context)
-        route = copy(self.route)
-        route._parameters = request.path_parameters
-        request.route = route
+        request.route = RouteMatch(self.route, request.path_parameters)
 
         return format_response_to_aws(event, super().__call__(request))
 
@@ -93,15 +91,15 @@ def format_response_to_aws(event: AwsEvent, response: HttpResponse) -> Dict[str,
     if not isinstance(content_type_header, str):
         content_type_header = content_type_header[0]
     mimetype, content_type_options = parse_header(content_type_header)
-    body = str(response)
 
     if (mimetype.startswith("text/") or mimetype in TEXT_MIME_TYPES) and not response.headers.get(
         "Content-Encoding", ""
     ):
-        serverless_response["body"] = body
+        serverless_response["body"] = str(response)
         serverless_response["isBase64Encoded"] = False
     else:
-        serverless_response["body"] = base64.b64encode(body.encode("utf8"))
+        # Binary bodies (e.g. MessagePack or CBOR) cannot be decoded as text
+        serverless_response["body"] = base64.b64encode(response.body.getvalue())
         serverless_response["isBase64Encoded"] = True
 
     return serverless_response
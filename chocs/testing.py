@@ -1,12 +1,13 @@
 from io import BytesIO
-from json import dumps as json_dumps
 from typing import Dict, Optional, Union
 
 from chocs.http.http_headers import HttpHeaders
+from chocs.http.http_json import get_json_codec
 from chocs.http.http_method import HttpMethod
 from chocs.http.http_query_string import HttpQueryString
 from chocs.http.http_request import HttpRequest
 from chocs.http.http_response import HttpResponse
+
 from .application import Application
 
 
@@ -88,7 +89,7 @@ class TestClient:
     def _create_request(
         method: HttpMethod,
         path: str,
-        body: Union[Optional[BytesIO], str],
+        body: Union[Optional[BytesIO], str, bytes],
         json: Optional[Dict] = None,
         headers: Optional[Union[HttpHeaders, Dict[str, str]]] = None,
     ) -> HttpRequest:
@@ -96,7 +97,7 @@ class TestClient:
             headers = {}
 
         if json:
-            body = json_dumps(json)
+            body = get_json_codec().dumps(json)
             headers["Content-Type"] = "application/json"
 
         path_parts = path.split("?")
@@ -0,0 +1,205 @@
+import os
+import signal
+import socket
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+BACKLOG = 2048
+POLL_INTERVAL = 0.5
+RESPAWN_DELAY = 1.0
+REUSE_PORT = hasattr(socket, "SO_REUSEPORT")
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _WorkerServer(WSGIServer):
+    def get_request(self) -> Tuple[socket.socket, Any]:
+        conn, address = super().get_request()
+        # On BSD and macOS accepted connection inherits non-blocking mode of the listening socket
+        conn.setblocking(True)
+
+        return conn, address
+
+
+def create_listening_socket(host: str, port: int, backlog: int = BACKLOG, shared: bool = False) -> socket.socket:
+    """
+    Creates listening socket. `SO_REUSEPORT` is set when platform supports it, so each worker can listen
+    on its own socket and kernel balances connections between them; it also lets another server (e.g.
+    a new release) bind the same port before this one shuts down. Without it one `shared` socket is used
+    by all workers.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if REUSE_PORT:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    if shared:
+        # Workers wait on the same socket, the ones which lose the race for a connection must not block
+        sock.setblocking(False)
+
+    return sock
+
+
+class PreforkWorker:
+    def __init__(self, wsgi_handler: Callable, sock: socket.socket, max_requests: int = 0):
+        self.wsgi_handler = wsgi_handler
+        self.socket = sock
+        self.max_requests = max_requests
+        self.handled_requests = 0
+        self.running = True
+
+    def stop(self, *_: Any) -> None:
+        self.running = False
+
+    def _count_requests(self, environ: Dict[str, Any], start: Callable) -> Any:
+        self.handled_requests += 1
+        if self.max_requests and self.handled_requests >= self.max_requests:
+            self.running = False
+
+        return self.wsgi_handler(environ, start)
+
+    def _create_server(self) -> WSGIServer:
+        host, port = self.socket.getsockname()[:2]
+        server = _WorkerServer((host, port), _QuietRequestHandler, bind_and_activate=False)
+        server.socket.close()
+        server.socket = self.socket
+        server.server_address = self.socket.getsockname()
+        server.server_name = host
+        server.server_port = port
+        server.timeout = POLL_INTERVAL
+        server.setup_environ()
+        server.set_app(self._count_requests)
+
+        return server
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+        server = self._create_server()
+        while self.running:
+            server.handle_request()
+
+
+class PreforkServer:
+    """
+    Forks `workers` processes serving requests on the same port, each from its own `SO_REUSEPORT`
+    socket or, where platform does not support it, from one shared listening socket. Master restarts
+    workers which exited (crashed or were recycled after `max_requests`) and on `SIGTERM`/`SIGINT`
+    lets workers finish requests in progress for up to `graceful_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        wsgi_handler: Callable,
+        host: str = "127.0.0.1",
+        port: int = 80,
+        workers: int = 1,
+        max_requests: int = 0,
+        graceful_timeout: float = 30.0,
+    ):
+        self.wsgi_handler = wsgi_handler
+        self.host = host
+        self.port = port
+        self.workers = max(workers, 1)
+        self.max_requests = max_requests
+        self.graceful_timeout = graceful_timeout
+        self.socket: Optional[socket.socket] = None
+        self.worker_pids: Dict[int, float] = {}
+        self.running = False
+        self._respawn_at = 0.0
+
+    def stop(self, *_: Any) -> None:
+        self.running = False
+
+    def _spawn_worker(self) -> None:
+        pid = os.fork()
+        if pid:
+            self.worker_pids[pid] = time.monotonic()
+            return
+
+        exit_code = 0
+        try:
+            sock = self.socket if self.socket is not None else create_listening_socket(self.host, self.port)
+            PreforkWorker(self.wsgi_handler, sock, self.max_requests).run()
+        except BaseException:
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap_workers(self) -> None:
+        while self.worker_pids:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.worker_pids.clear()
+                return
+            if not pid:
+                return
+            started_at = self.worker_pids.pop(pid, 0.0)
+            if time.monotonic() - started_at < RESPAWN_DELAY:
+                # Worker failed right after start, delay respawning to avoid a fork loop
+                self._respawn_at = time.monotonic() + RESPAWN_DELAY
+
+    def _stop_workers(self) -> None:
+        for pid in self.worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.worker_pids and time.monotonic() < deadline:
+            self._reap_workers()
+            time.sleep(0.05)
+
+        for pid in self.worker_pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        while self.worker_pids:
+            try:
+                pid, _ = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+            self.worker_pids.pop(pid, None)
+
+    def run(self) -> None:
+        if REUSE_PORT:
+            # Kernel balances connections only between separate sockets, so workers bind their own after
+            # fork; binding here just reports unavailable address before any worker is started
+            create_listening_socket(self.host, self.port).close()
+        else:
+            self.socket = create_listening_socket(self.host, self.port, shared=True)
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        try:
+            while self.running:
+                self._reap_workers()
+                while self.running and len(self.worker_pids) < self.workers and time.monotonic() >= self._respawn_at:
+                    self._spawn_worker()
+                time.sleep(POLL_INTERVAL / 5)
+        finally:
+            self._stop_workers()
+            if self.socket is not None:
+                self.socket.close()
+
+
+def wsgi_serve(
+    wsgi_handler: Callable,
+    host: str = "127.0.0.1",
+    port: int = 80,
+    workers: int = 1,
+    max_requests: int = 0,
+) -> None:
+    PreforkServer(wsgi_handler, host, port, workers, max_requests).run()
@@ -0,0 +1,92 @@
+from io import BytesIO
+from typing import Any, Dict, Optional
+
+from chocs.http.http_body import HttpRequestBody, RequestBody
+from chocs.http.http_headers import HttpHeaders
+from chocs.http.http_method import HttpMethod
+from chocs.http.http_query_string import HttpQueryString
+from chocs.http.http_request import HttpRequest
+from chocs.routing import RouteMatch
+
+_HTTP_METHODS: Dict[str, HttpMethod] = {method.value: method for method in HttpMethod}
+
+
+def _get_content_length(environ: Dict[str, Any]) -> Optional[int]:
+    try:
+        return max(int(environ.get("CONTENT_LENGTH") or ""), 0)
+    except ValueError:
+        # Without content length, input can be read until the end only if server terminates it
+        return None if environ.get("wsgi.input_terminated") else 0
+
+
+class WsgiHttpRequest(HttpRequest):
+    """
+    Request backed by WSGI environ. Only method and path are read upfront, which is all routing
+    needs; headers, query string, cookies and body are created from the environ on first access.
+    """
+
+    def __init__(self, environ: Dict[str, Any], spool_size: int = 0, encoding: str = "utf-8"):
+        request_method = environ.get("REQUEST_METHOD", "GET")
+        method = _HTTP_METHODS.get(request_method)
+
+        self.environ = environ
+        self.method = method if method is not None else HttpMethod(request_method.upper())
+        self.path = environ.get("PATH_INFO", "/")
+        self.path_parameters: Dict[str, str] = {}
+        self.route: Optional[RouteMatch] = None  # type: ignore
+        self.attributes: Dict[str, Any] = {}
+        self.encoding = encoding
+        self.spool_size = spool_size
+        self._lazy_headers: Optional[HttpHeaders] = None
+        self._lazy_query_string: Optional[HttpQueryString] = None
+        self._lazy_body: Optional[RequestBody] = None
+        self._cookies = None
+        self._parsed_body = None
+        self._as_dict = None
+        self._as_str = None
+
+    @property  # type: ignore
+    def _headers(self) -> HttpHeaders:  # type: ignore
+        if self._lazy_headers is None:
+            headers = HttpHeaders()
+            for key, value in self.environ.items():
+                if key.startswith("HTTP"):
+                    headers.set(key, value)
+            headers.set("Content-Type", self.environ.get("CONTENT_TYPE", "text/plain"))
+            self._lazy_headers = headers
+
+        return self._lazy_headers
+
+    @_headers.setter
+    def _headers(self, value: HttpHeaders) -> None:
+        self._lazy_headers = value
+
+    @property  # type: ignore
+    def query_string(self) -> HttpQueryString:  # type: ignore
+        if self._lazy_query_string is None:
+            self._lazy_query_string = HttpQueryString(self.environ.get("QUERY_STRING", ""))
+
+        return self._lazy_query_string
+
+    @query_string.setter
+    def query_string(self, value: HttpQueryString) -> None:
+        self._lazy_query_string = value
+
+    @property  # type: ignore
+    def _body(self) -> RequestBody:  # type: ignore
+        if self._lazy_body is None:
+            if "wsgi.input" in self.environ:  # unify all the different types of wsgi server implementations
+                self._lazy_body = HttpRequestBody(
+                    self.environ["wsgi.input"], _get_content_length(self.environ), self.spool_size
+                )
+            else:
+                self._lazy_body = BytesIO(b"")
+
+        return self._lazy_body
+
+    @_body.setter
+    def _body(self, value: RequestBody) -> None:
+        self._lazy_body = value
+
+
+__all__ = ["WsgiHttpRequest"]
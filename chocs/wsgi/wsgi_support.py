@@ -1,65 +1,79 @@
 from enum import Enum
-from io import BytesIO
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from chocs.application import Application
 from chocs.http.http_error import HttpError
-from chocs.http.http_headers import HttpHeaders
-from chocs.http.http_method import HttpMethod
-from chocs.http.http_query_string import HttpQueryString
+from chocs.http.http_file_response import FileResponse
 from chocs.http.http_request import HttpRequest
-from chocs.http.http_response import HttpResponse
+from chocs.http.http_response import HttpResponse, StreamingHttpResponse
+from chocs.http.http_status import HttpStatus
 
+from .wsgi_http_request import WsgiHttpRequest
 
-def create_http_request_from_wsgi(environ: Dict[str, Any]) -> HttpRequest:
-    headers = HttpHeaders()
-    for key, value in environ.items():
-        if not key.startswith("HTTP"):
-            continue
-        headers.set(key, value)
-    headers.set("Content-Type", environ.get("CONTENT_TYPE", "text/plain"))
 
-    if "wsgi.input" in environ:  # unify all the different types of wsgi server implementations
-        body = BytesIO(environ["wsgi.input"].read())
-    else:
-        body = BytesIO(b"")
+def create_http_request_from_wsgi(environ: Dict[str, Any], spool_size: int = 0) -> HttpRequest:
+    """
+    Request's headers, query string and body are read from the environ on first access. Body is read
+    lazily from `wsgi.input`, when `spool_size` is greater than zero body exceeding that size
+    is kept in a temporary file instead of memory.
+    """
+    return WsgiHttpRequest(environ, spool_size)
+
+
+_STATUS_LINES: Dict[int, str] = {int(status): str(status) for status in HttpStatus}
+# Responses which cannot have content must not advertise length of an empty one (RFC 9110, 8.6)
+_NO_CONTENT_LENGTH_STATUSES = frozenset(
+    [int(status) for status in HttpStatus if int(status) < 200]
+    + [int(HttpStatus.NO_CONTENT), int(HttpStatus.NOT_MODIFIED)]
+)
+
 
-    return HttpRequest(
-        method=HttpMethod(environ.get("REQUEST_METHOD", "GET").upper()),
-        path=environ.get("PATH_INFO", "/"),
-        body=body,
-        query_string=HttpQueryString(environ.get("QUERY_STRING", "")),
-        headers=headers,
-    )
+def serialise_wsgi_response(response: HttpResponse) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Returns status line and list of headers for WSGI's `start_response`.
+    """
+    headers = response.headers.as_list()
+    if (
+        "content-length" not in response.headers
+        and int(response.status_code) not in _NO_CONTENT_LENGTH_STATUSES
+        and not (isinstance(response, StreamingHttpResponse) and response.streaming)
+    ):
+        headers.append(("content-length", str(response.body.getbuffer().nbytes)))
+    for cookie in response.cookies.values():
+        headers.append(("set-cookie", cookie.serialise()))
+
+    return _STATUS_LINES[int(response.status_code)], headers
 
 
 def create_wsgi_handler(
-    application: Application, debug: bool = False
-) -> Callable[[Dict[str, Any], Callable[..., Any]], BytesIO]:
-    def _handler(environ: Dict[str, Any], start: Callable) -> BytesIO:
-        request = create_http_request_from_wsgi(environ)
+    application: Application, debug: bool = False, spool_size: int = 0
+) -> Callable[[Dict[str, Any], Callable[..., Any]], Iterable[bytes]]:
+    application.freeze()
+
+    def _handler(environ: Dict[str, Any], start: Callable) -> Iterable[bytes]:
+        request = create_http_request_from_wsgi(environ, spool_size)
         if debug:
             try:
                 response = application(request)
             except HttpError as http_error:
-                response = HttpResponse(http_error.http_message, http_error.status_code)
+                response = HttpResponse(http_error.http_message, http_error.status_code, http_error.headers)
         else:
             # Always send a response
             try:
                 response = application(request)
             except HttpError as http_error:
-                response = HttpResponse(http_error.http_message, http_error.status_code)
+                response = HttpResponse(http_error.http_message, http_error.status_code, http_error.headers)
             except Exception:
                 response = HttpResponse("Internal Server Error", 500)
 
-        headers = response.headers
-        for cookie in response.cookies.values():
-            headers.set("Set-Cookie", cookie.serialise())
+        start(*serialise_wsgi_response(response))
 
-        start(
-            str(int(response.status_code)),
-            [(key, value) for key, value in headers.items()],
-        )
+        if isinstance(response, StreamingHttpResponse) and response.streaming:
+            if isinstance(response, FileResponse) and response.reaches_end_of_file and "wsgi.file_wrapper" in environ:
+                # Server can send rest of the file with sendfile
+                response.file.seek(response.offset)
+                return environ["wsgi.file_wrapper"](response.file, response.chunk_size)
+            return response
 
         response.body.seek(0)
         return response.body
@@ -72,6 +86,7 @@ class WsgiServers(Enum):
     GUNICORN = "gunicorn"
     BJOERN = "bjoern"
     CHERRYPY = "cherrypy"
+    PREFORK = "prefork"
 
 
 def serve(
@@ -81,9 +96,11 @@ def serve(
     workers: int = 1,
     debug: bool = False,
     wsgi_server: WsgiServers = WsgiServers.DEFAULT,
+    spool_size: int = 0,
+    max_requests: int = 0,
 ) -> None:
 
-    wsgi_handler = create_wsgi_handler(application, debug=debug)
+    wsgi_handler = create_wsgi_handler(application, debug=debug, spool_size=spool_size)
     wsgi_options = {
         "host": host,
         "port": port,
@@ -108,6 +125,11 @@ def serve(
         except ImportError:
             raise RuntimeError("`cheroot` package must be installed before using `chocs.serve`.")
 
+    elif wsgi_server == WsgiServers.PREFORK:
+        from .prefork_support import wsgi_serve  # type: ignore
+
+        wsgi_options["max_requests"] = max_requests
+
     else:
         raise RuntimeError("Unsupported wsgi server")
 
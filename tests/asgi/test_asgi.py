@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any, Dict, List
+
+from chocs import Application, HttpCookie, HttpRequest, HttpResponse, HttpStatus, StreamingHttpResponse
+from chocs.asgi import asgi_support, create_asgi_handler
+
+
+def _call_asgi(handler, scope: Dict[str, Any], messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    sent: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    asyncio.run(handler(scope, receive, send))
+
+    return sent
+
+
+def _http_scope(method: str, path: str, query_string: bytes = b"", headers: list = []) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": headers,
+    }
+
+
+def test_create_asgi_handler() -> None:
+    app = Application()
+
+    @app.post("/pets/{id}")
+    async def create_pet(request: HttpRequest) -> HttpResponse:
+        response = HttpResponse(
+            f"{request.path_parameters['id']}:{request.query_string['name']}:{request.body.read().decode()}",
+            HttpStatus.CREATED,
+            headers={"content-type": str(request.headers["content-type"])},
+        )
+        response.cookies.append(HttpCookie(name="test", value="SuperCookie"))
+        return response
+
+    handler = create_asgi_handler(app)
+
+    sent = _call_asgi(
+        handler,
+        _http_scope("POST", "/pets/1", b"name=Bob", [(b"content-type", b"text/csv")]),
+        [
+            {"type": "http.request", "body": b"chunked ", "more_body": True},
+            {"type": "http.request", "body": b"body", "more_body": False},
+        ],
+    )
+
+    assert sent == [
+        {
+            "type": "http.response.start",
+            "status": 201,
+            "headers": [(b"content-type", b"text/csv"), (b"set-cookie", b"test=SuperCookie")],
+        },
+        {"type": "http.response.body", "body": b"1:Bob:chunked body", "more_body": False},
+    ]
+
+
+def test_asgi_handler_sends_large_body_in_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(asgi_support, "CHUNK_SIZE", 4)
+    app = Application()
+
+    @app.get("/")
+    def index(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("0123456789")
+
+    sent = _call_asgi(create_asgi_handler(app), _http_scope("GET", "/"), [{"type": "http.request"}])
+
+    assert [message["body"] for message in sent[1:]] == [b"0123", b"4567", b"89"]
+    assert [message["more_body"] for message in sent[1:]] == [True, True, False]
+
+
+def test_asgi_handler_responds_with_http_errors() -> None:
+    app = Application()
+
+    sent = _call_asgi(create_asgi_handler(app), _http_scope("GET", "/missing"), [{"type": "http.request"}])
+
+    assert sent[0]["status"] == 404
+
+
+def test_asgi_handler_supports_lifespan() -> None:
+    sent = _call_asgi(
+        create_asgi_handler(Application()),
+        {"type": "lifespan", "asgi": {"version": "3.0"}},
+        [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}],
+    )
+
+    assert sent == [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}]
+
+
+def test_asgi_handler_sends_streaming_response_in_chunks() -> None:
+    app = Application()
+
+    async def generate_rows():
+        for row in range(2):
+            yield f"{row}\n"
+
+    @app.get("/async")
+    def async_export(request: HttpRequest) -> HttpResponse:
+        return StreamingHttpResponse(generate_rows())
+
+    @app.get("/sync")
+    def sync_export(request: HttpRequest) -> HttpResponse:
+        return StreamingHttpResponse([b"a", b"b"])
+
+    handler = create_asgi_handler(app)
+    async_sent = _call_asgi(handler, _http_scope("GET", "/async"), [{"type": "http.request"}])
+    sync_sent = _call_asgi(handler, _http_scope("GET", "/sync"), [{"type": "http.request"}])
+
+    assert [(message["body"], message["more_body"]) for message in async_sent[1:]] == [
+        (b"0\n", True),
+        (b"1\n", True),
+        (b"", False),
+    ]
+    assert [message["body"] for message in sync_sent[1:]] == [b"a", b"b", b""]
@@ -0,0 +1,113 @@
+from io import BytesIO
+from typing import Any, Sequence
+
+import pytest
+
+from chocs.http import (
+    BinaryHttpMessage,
+    CborHttpMessage,
+    CborResponse,
+    HttpMethod,
+    HttpRequest,
+    JsonResponse,
+    MsgpackHttpMessage,
+    MsgpackResponse,
+    SerialisedResponse,
+    negotiate_media_type,
+    negotiate_response,
+    parse_accept,
+)
+from chocs.http.http_binary_codecs import cbor_available, msgpack_available
+
+payload = {"values": [1, 2.5, -3], "name": "ł", "nested": {"flag": True, "empty": None}}
+
+
+def test_can_parse_accept_header() -> None:
+    assert parse_accept("text/html;q=0.5, Application/JSON, */*;q=0.1, image/png") == (
+        ("application/json", 1.0),
+        ("image/png", 1.0),
+        ("text/html", 0.5),
+        ("*/*", 0.1),
+    )
+
+
+@pytest.mark.parametrize(
+    "accept,available,expected",
+    [
+        ("", ["application/json", "application/msgpack"], "application/json"),
+        ("application/msgpack", ["application/json", "application/msgpack"], "application/msgpack"),
+        ("application/msgpack, application/json", ["application/json", "application/msgpack"], "application/msgpack"),
+        ("application/json;q=0.5, application/*", ["application/json", "application/cbor"], "application/cbor"),
+        ("*/*", ["application/json", "application/cbor"], "application/json"),
+        ("*/*, application/json;q=0", ["application/json", "application/cbor"], "application/cbor"),
+        ("text/html", ["application/json"], None),
+        ("application/json;q=0", ["application/json"], None),
+    ],
+)
+def test_can_negotiate_media_type(accept: str, available: Sequence[str], expected: Any) -> None:
+    assert negotiate_media_type(accept, available) == expected
+
+
+def test_negotiated_response_falls_back_to_json() -> None:
+    request = HttpRequest(HttpMethod.GET, headers={"accept": "text/html"})
+    response = negotiate_response(request, payload)
+
+    assert isinstance(response, JsonResponse)
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["vary"] == "accept"
+    assert response.parsed_body.data == payload
+
+
+def test_msgpack_messages() -> None:
+    pytest.importorskip("msgpack")
+    response = MsgpackResponse(payload)
+    request = HttpRequest(
+        HttpMethod.POST, body=response.body.getvalue(), headers={"content-type": "application/msgpack"}
+    )
+
+    assert response.headers["content-type"] == "application/msgpack"
+    assert isinstance(request.parsed_body, MsgpackHttpMessage)
+    assert request.parsed_body.data == payload
+    assert MsgpackHttpMessage.from_bytes(BytesIO(b"\xc1")).data == {}
+
+
+def test_cbor_messages() -> None:
+    pytest.importorskip("cbor2")
+    response = CborResponse(payload)
+    request = HttpRequest(HttpMethod.POST, body=response.body.getvalue(), headers={"content-type": "application/cbor"})
+
+    assert response.headers["content-type"] == "application/cbor"
+    assert isinstance(request.parsed_body, CborHttpMessage)
+    assert request.parsed_body.data == payload
+    assert CborHttpMessage.from_bytes(BytesIO(b"\x18")).data == {}
+
+
+def test_can_negotiate_msgpack_response() -> None:
+    pytest.importorskip("msgpack")
+    request = HttpRequest(HttpMethod.GET, headers={"accept": "application/x-msgpack, application/json"})
+    response = negotiate_response(request, payload)
+
+    assert isinstance(response, MsgpackResponse)
+    assert response.headers["content-type"] == "application/x-msgpack"
+
+
+@pytest.mark.skipif(msgpack_available() and cbor_available(), reason="msgpack and cbor2 are installed")
+def test_fails_when_binary_format_package_is_missing() -> None:
+    with pytest.raises(RuntimeError):
+        if not msgpack_available():
+            MsgpackResponse(payload)
+        else:
+            CborResponse(payload)
+
+
+@pytest.mark.skipif(msgpack_available(), reason="msgpack is installed")
+def test_msgpack_body_is_binary_message_when_package_is_missing() -> None:
+    request = HttpRequest(HttpMethod.POST, body=b"\x81\xa1a\x01", headers={"content-type": "application/msgpack"})
+
+    assert isinstance(request.parsed_body, BinaryHttpMessage)
+    assert request.parsed_body.getvalue() == b"\x81\xa1a\x01"
+
+
+def test_serialised_response_requires_serialise_method() -> None:
+    with pytest.raises(TypeError):
+        SerialisedResponse(payload)  # type: ignore
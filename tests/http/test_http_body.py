@@ -0,0 +1,80 @@
+import io
+from copy import copy
+from io import BytesIO
+
+import pytest
+
+from chocs.http import HttpMethod, HttpRequest, HttpRequestBody
+
+
+class CountingInput(BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):  # type: ignore
+        self.reads.append(size)
+        return super().read(size)
+
+
+def test_body_is_read_lazily_up_to_content_length() -> None:
+    source = CountingInput(b"0123456789next request")
+    body = HttpRequestBody(source, 10)
+
+    assert source.reads == []
+    assert body.read(4) == b"0123"
+    assert body.read() == b"456789"
+    assert body.read() == b""
+    assert source.tell() == 10
+
+
+def test_body_can_be_rewound() -> None:
+    body = HttpRequestBody(BytesIO(b"line 1\nline 2\nline 3"), None)
+
+    assert body.readline() == b"line 1\n"
+    body.seek(0)
+    assert list(body) == [b"line 1\n", b"line 2\n", b"line 3"]
+    assert body.getvalue() == b"line 1\nline 2\nline 3"
+    assert body.seek(-6, io.SEEK_END) == 14
+
+
+def test_body_is_spooled_to_disk() -> None:
+    body = HttpRequestBody(BytesIO(b"a" * 100), 100, spool_size=10)
+
+    assert body.read(5) == b"aaaaa"
+    assert not body._buffer._rolled  # type: ignore
+    assert body.read() == b"a" * 95
+    assert body._buffer._rolled  # type: ignore
+
+
+def test_can_stream_body_without_buffering() -> None:
+    body = HttpRequestBody(BytesIO(b"0123456789"), 10)
+
+    assert body.read(3) == b"012"
+    body.seek(0)
+    assert list(body.stream(4)) == [b"012", b"3456", b"789"]
+    assert body._length == 3
+
+    assert body.consumed
+    with pytest.raises(io.UnsupportedOperation):
+        body.read()
+
+
+def test_streamed_body_is_kept_when_spooled() -> None:
+    body = HttpRequestBody(BytesIO(b"0123456789"), 10, spool_size=4)
+
+    assert list(body.stream(4)) == [b"0123", b"4567", b"89"]
+    assert not body.consumed
+    assert body._buffer._rolled  # type: ignore
+    body.seek(0)
+    assert body.read() == b"0123456789"
+
+
+def test_consumed_body_is_read_as_empty() -> None:
+    request = HttpRequest(HttpMethod.POST, body=HttpRequestBody(BytesIO(b"0123456789"), 10))
+    list(request.body.stream())  # type: ignore
+
+    assert request.as_str() == ""
+    assert str(request) == ""
+    assert str(copy(request)) == ""
+    assert request == HttpRequest(HttpMethod.POST)
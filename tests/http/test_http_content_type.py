@@ -0,0 +1,89 @@
+from typing import Any, BinaryIO, Dict
+
+import pytest
+
+from chocs.http import (
+    BinaryHttpMessage,
+    HttpMethod,
+    HttpRequest,
+    SimpleHttpMessage,
+    get_http_message_parser,
+    parse_content_disposition,
+    parse_content_type,
+    parse_header,
+    parse_multipart_message,
+    register_http_message_parser,
+)
+from chocs.http.http_content_type import _parse_cached_header
+from chocs.http.http_parsed_body import _http_message_parsers
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("text/plain", ("text/plain", {})),
+        ("text/html; charset=UTF-8", ("text/html", {"charset": "UTF-8"})),
+        ('multipart/form-data; Boundary="a;b"', ("multipart/form-data", {"boundary": "a;b"})),
+        ('form-data; name="file"; filename="a \\"b\\".txt"', ("form-data", {"name": "file", "filename": 'a "b".txt'})),
+        ("application/json; invalid; charset=utf-8", ("application/json", {"charset": "utf-8"})),
+        ("", ("", {})),
+    ],
+)
+def test_can_parse_header(header: str, expected: Any) -> None:
+    assert parse_header(header) == expected
+
+
+def test_content_disposition_of_multipart_parts_is_not_cached() -> None:
+    _parse_cached_header.cache_clear()
+    fields = parse_multipart_message(
+        b'--boundary\r\nContent-Disposition: form-data; name="file"; filename="a.txt"\r\n\r\ndata\r\n--boundary--',
+        "boundary",
+    )
+
+    assert fields["file"].filename == "a.txt"
+    assert parse_content_disposition('form-data; name="file"') == ("form-data", {"name": "file"})
+    assert _parse_cached_header.cache_info().currsize == 0
+
+
+def test_parsed_parameters_are_not_shared_between_calls() -> None:
+    _, parameters = parse_header("text/plain; charset=utf-8")
+    parameters["charset"] = "latin-1"
+
+    assert parse_header("text/plain; charset=utf-8")[1] == {"charset": "utf-8"}
+
+
+def test_content_type_is_lowercase() -> None:
+    assert parse_content_type("Application/JSON; Charset=UTF-8") == ("application/json", {"charset": "UTF-8"})
+
+
+class CsvMessage(list):
+    pass
+
+
+def _parse_csv(body: BinaryIO, parameters: Dict[str, str]) -> CsvMessage:
+    body.seek(0)
+    return CsvMessage(body.read().decode(parameters.get("charset", "utf8")).split(","))
+
+
+@pytest.fixture
+def csv_parser():
+    register_http_message_parser(["text/csv", "application/csv"], _parse_csv)
+    yield
+    _http_message_parsers.pop("text/csv")
+    _http_message_parsers.pop("application/csv")
+
+
+def test_can_register_http_message_parser(csv_parser) -> None:
+    request = HttpRequest(HttpMethod.POST, body="a,b", headers={"content-type": "Application/CSV"})
+
+    assert request.parsed_body == ["a", "b"]
+    assert isinstance(request.parsed_body, CsvMessage)
+
+
+def test_falls_back_to_wildcard_and_binary_parsers() -> None:
+    text_request = HttpRequest(HttpMethod.POST, body="a,b", headers={"content-type": "text/csv"})
+    binary_request = HttpRequest(HttpMethod.POST, body=b"\x00", headers={"content-type": "image/png"})
+
+    assert isinstance(text_request.parsed_body, SimpleHttpMessage)
+    assert isinstance(binary_request.parsed_body, BinaryHttpMessage)
+    assert get_http_message_parser("text/csv") is get_http_message_parser("text/x-unknown")
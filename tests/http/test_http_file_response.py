@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from chocs import FileResponse, HttpMethod, HttpRequest, HttpStatus
+
+
+@pytest.fixture
+def report_file(tmp_path) -> str:
+    path = tmp_path / "report.csv"
+    path.write_bytes(b"0123456789")
+    return str(path)
+
+
+def test_can_stream_file(report_file: str) -> None:
+    response = FileResponse(report_file, chunk_size=4)
+
+    assert response.status_code == HttpStatus.OK
+    assert response.headers["content-type"] == "text/csv"
+    assert response.headers["content-length"] == "10"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == response.etag
+    assert list(response) == [b"0123", b"4567", b"89"]
+    assert response.file.closed
+
+
+@pytest.mark.parametrize(
+    "range_header, content_range, body",
+    [
+        ("bytes=2-4", "bytes 2-4/10", b"234"),
+        ("bytes=7-", "bytes 7-9/10", b"789"),
+        ("bytes=-3", "bytes 7-9/10", b"789"),
+        ("bytes=8-100", "bytes 8-9/10", b"89"),
+    ],
+)
+def test_can_respond_with_partial_content(report_file: str, range_header: str, content_range: str, body: bytes) -> None:
+    request = HttpRequest(HttpMethod.GET, headers={"Range": range_header})
+    response = FileResponse(report_file, request)
+
+    assert response.status_code == HttpStatus.PARTIAL_CONTENT
+    assert response.headers["content-range"] == content_range
+    assert response.headers["content-length"] == str(len(body))
+    assert b"".join(response) == body
+
+
+def test_responds_with_416_for_unsatisfiable_range(report_file: str) -> None:
+    response = FileResponse(report_file, HttpRequest(HttpMethod.GET, headers={"Range": "bytes=10-"}))
+
+    assert response.status_code == HttpStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.headers["content-range"] == "bytes */10"
+    assert response.file.closed
+
+
+def test_ignores_range_when_if_range_does_not_match(report_file: str) -> None:
+    request = HttpRequest(HttpMethod.GET, headers={"Range": "bytes=2-4", "If-Range": '"outdated"'})
+    response = FileResponse(report_file, request)
+
+    assert response.status_code == HttpStatus.OK
+    assert b"".join(response) == b"0123456789"
+
+    etag = FileResponse(report_file).etag
+    request = HttpRequest(HttpMethod.GET, headers={"Range": "bytes=2-4", "If-Range": etag})
+    assert FileResponse(report_file, request).status_code == HttpStatus.PARTIAL_CONTENT
+
+
+def test_responds_with_304_when_file_was_not_modified(report_file: str) -> None:
+    etag = FileResponse(report_file).etag
+    last_modified = FileResponse(report_file).last_modified
+
+    by_etag = FileResponse(report_file, HttpRequest(HttpMethod.GET, headers={"If-None-Match": etag}))
+    by_date = FileResponse(report_file, HttpRequest(HttpMethod.GET, headers={"If-Modified-Since": last_modified}))
+
+    assert by_etag.status_code == HttpStatus.NOT_MODIFIED
+    assert by_date.status_code == HttpStatus.NOT_MODIFIED
+    assert "content-length" not in by_etag.headers
+    assert str(by_etag) == ""
+
+
+def test_closes_file_when_response_cannot_be_created(report_file: str) -> None:
+    with open(report_file, "rb") as file:
+        with pytest.raises(AttributeError):
+            FileResponse(file, request=object())  # type: ignore
+
+        assert file.closed
+
+
+def test_can_respond_with_open_file(report_file: str) -> None:
+    with open(report_file, "rb") as file:
+        response = FileResponse(file, filename="export.csv")
+
+        assert response.headers["content-disposition"] == 'attachment; filename="export.csv"'
+        assert str(response) == "0123456789"
+
+
+@pytest.mark.parametrize(
+    "filename, content_disposition",
+    [
+        ('a"; x="y\r\nSet-Cookie: pwned=1', 'attachment; filename="a\\"; x=\\"ySet-Cookie: pwned=1"'),
+        ("back\\slash.csv", 'attachment; filename="back\\\\slash.csv"'),
+        ("raport ł.csv", "attachment; filename=\"raport ?.csv\"; filename*=UTF-8''raport%20%C5%82.csv"),
+    ],
+)
+def test_escapes_attachment_filename(report_file: str, filename: str, content_disposition: str) -> None:
+    response = FileResponse(report_file, filename=filename)
+
+    assert response.headers["content-disposition"] == content_disposition
+    response.close()
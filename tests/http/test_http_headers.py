@@ -82,3 +82,8 @@ def test_can_copy() -> None:
     assert instance_copy['c'] == 'c'
     assert instance_copy['a'] == 'a'
 
+
+def test_can_convert_headers_to_list() -> None:
+    headers = HttpHeaders({"Content-Type": "text/plain", "Set-Cookie": ["a=1", "b=2"]})
+
+    assert headers.as_list() == [("content-type", "text/plain"), ("set-cookie", "a=1"), ("set-cookie", "b=2")]
@@ -0,0 +1,75 @@
+from io import BytesIO
+from typing import Any, Union
+
+import pytest
+
+from chocs.http import JsonCodec, JsonHttpMessage, StdlibJsonCodec, get_json_codec, register_json_codec, set_json_codec
+
+
+class RecordingCodec(StdlibJsonCodec):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        self.calls += 1
+        return super().loads(data)
+
+
+@pytest.fixture
+def restore_json_codec():
+    codec = get_json_codec()
+    yield
+    set_json_codec(codec)
+
+
+def test_stdlib_codec_works_with_bytes() -> None:
+    codec = StdlibJsonCodec()
+
+    assert codec.dumps({"a": [1, None], "b": "ąę"}) == '{"a":[1,null],"b":"ąę"}'.encode("utf-8")
+    assert codec.loads(b'{"a": 1}') == {"a": 1}
+    assert codec.loads(memoryview(b"[1]")) == [1]
+    with pytest.raises(ValueError):
+        codec.loads(b"{")
+
+
+def test_can_set_codec_by_instance(restore_json_codec) -> None:
+    codec = RecordingCodec()
+    set_json_codec(codec)
+
+    message = JsonHttpMessage.from_bytes(BytesIO(b'{"a": 1}'))
+
+    assert message.data == {"a": 1}
+    assert codec.calls == 1
+
+
+def test_can_set_codec_by_name(restore_json_codec) -> None:
+    codec = RecordingCodec()
+    register_json_codec("recording", codec)
+    set_json_codec("recording")
+
+    assert get_json_codec() is codec
+
+
+def test_fails_on_unknown_codec() -> None:
+    with pytest.raises(ValueError):
+        set_json_codec("unknown")
+
+
+def test_can_use_orjson(restore_json_codec) -> None:
+    pytest.importorskip("orjson")
+    set_json_codec("orjson")
+    codec = get_json_codec()
+
+    assert isinstance(codec, JsonCodec)
+    assert codec.loads(codec.dumps({"a": [1.5, "ł"]})) == {"a": [1.5, "ł"]}
+    assert JsonHttpMessage.from_bytes(BytesIO(b'{"a": 1}')).data == {"a": 1}
+
+
+def test_json_message_is_empty_for_invalid_document() -> None:
+    assert JsonHttpMessage.from_bytes(BytesIO(b"{invalid")).data == {}
+
+
+def test_json_message_decodes_non_utf8_charset() -> None:
+    message = JsonHttpMessage.from_bytes(BytesIO('{"a": "ł"}'.encode("utf-16")), "utf-16")
+
+    assert message.data == {"a": "ł"}
@@ -0,0 +1,170 @@
+import tracemalloc
+from io import BytesIO
+
+import pytest
+
+from chocs import Application, HttpMethod, HttpRequest, HttpResponse, HttpStatus
+from chocs.http import PayloadTooLargeError, parse_multipart_stream
+from chocs.http.http_body import HttpRequestBody
+from chocs.http.http_multipart_message_parser import (
+    MultipartParser,
+    UploadedFile,
+    UploadLimits,
+    parse_multipart_message,
+    set_upload_limits,
+)
+
+message = (
+    b"preamble\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="text"\r\n\r\n'
+    b"line\r\n--other\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="data.bin"\r\n'
+    b"Content-Type: Application/Octet-Stream\r\n\r\n" + bytes(range(256)) * 10 + b"\r\n--boundary--\r\n"
+    b"epilogue"
+)
+
+
+def test_can_parse_message() -> None:
+    fields = parse_multipart_message(message, "boundary")
+
+    assert fields["text"] == "line\r\n--other"
+    assert isinstance(fields["file"], UploadedFile)
+    assert fields["file"].mimetype == "application/octet-stream"
+    assert fields["file"].filename == "data.bin"
+    assert fields["file"].length == 2560
+    assert fields["file"].read() == bytes(range(256)) * 10
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 11, 64])
+def test_can_parse_message_split_into_chunks(chunk_size: int) -> None:
+    parser = MultipartParser("boundary")
+    for index in range(0, len(message), chunk_size):
+        parser.feed(message[index : index + chunk_size])
+    fields = parser.close()
+
+    assert fields["text"] == "line\r\n--other"
+    assert fields["file"].read() == bytes(range(256)) * 10
+
+
+def test_can_parse_stream() -> None:
+    fields = parse_multipart_stream(BytesIO(message), "boundary", chunk_size=16)
+
+    assert len(fields["file"]) == 2560
+
+
+def test_can_parse_request_body_without_buffering_it() -> None:
+    # given
+    upload = (
+        b'--boundary\r\nContent-Disposition: form-data; name="file"; filename="large.bin"\r\n\r\n'
+        + b"x" * 8 * 1024 * 1024
+        + b"\r\n--boundary--\r\n"
+    )
+    request = HttpRequest(
+        HttpMethod.POST,
+        body=HttpRequestBody(BytesIO(upload), len(upload)),
+        headers={"content-type": "multipart/form-data; boundary=boundary"},
+    )
+
+    # when
+    tracemalloc.start()
+    try:
+        fields = request.parsed_body
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # then
+    assert len(fields["file"]) == 8 * 1024 * 1024
+    assert peak < 4 * 1024 * 1024
+
+
+def test_spooled_request_body_can_be_read_after_parsing() -> None:
+    request = HttpRequest(
+        HttpMethod.POST,
+        body=HttpRequestBody(BytesIO(message), len(message), spool_size=64),
+        headers={"content-type": "multipart/form-data; boundary=boundary"},
+    )
+
+    assert request.parsed_body["text"] == "line\r\n--other"
+    assert request.body.getvalue() == message
+
+
+def test_fails_on_message_without_closing_boundary() -> None:
+    with pytest.raises(IOError):
+        parse_multipart_message(b'--boundary\r\nContent-Disposition: form-data; name="a"\r\n\r\nvalue', "boundary")
+
+
+def test_fails_on_invalid_boundary() -> None:
+    with pytest.raises(IOError):
+        parse_multipart_message(message, "other")
+
+
+def test_keeps_small_files_in_memory() -> None:
+    fields = parse_multipart_message(message, "boundary", limits=UploadLimits(spool_size=4096))
+
+    assert not fields["file"].file._rolled
+    assert len(fields["file"]) == 2560
+
+
+def test_moves_big_files_to_disk() -> None:
+    fields = parse_multipart_message(message, "boundary", limits=UploadLimits(spool_size=1024))
+
+    assert fields["file"].file._rolled
+    assert len(fields["file"]) == 2560
+    assert fields["file"].read() == bytes(range(256)) * 10
+
+
+def test_writes_files_straight_to_disk_without_spool() -> None:
+    fields = parse_multipart_message(message, "boundary", limits=UploadLimits(spool_size=0))
+
+    assert not hasattr(fields["file"].file, "_rolled")
+    assert fields["file"].file.fileno() >= 0
+    assert fields["file"].read() == bytes(range(256)) * 10
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [
+        UploadLimits(max_part_size=1024),
+        UploadLimits(max_request_size=len(message) - 1),
+    ],
+)
+def test_fails_on_too_large_upload(limits: UploadLimits) -> None:
+    stream = BytesIO(message)
+    with pytest.raises(PayloadTooLargeError):
+        parse_multipart_stream(stream, "boundary", chunk_size=256, limits=limits)
+
+    if limits.max_part_size:
+        # Reading stops as soon as the limit is exceeded
+        assert stream.tell() < len(message)
+
+
+def test_accepts_upload_within_limits() -> None:
+    limits = UploadLimits(max_part_size=2560, max_request_size=len(message))
+    fields = parse_multipart_message(message, "boundary", limits=limits)
+
+    assert len(fields["file"]) == 2560
+
+
+def test_application_responds_with_413_to_too_large_upload() -> None:
+    app = Application()
+
+    @app.post("/upload")
+    def upload(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(str(len(request.parsed_body["file"])))
+
+    request = HttpRequest(
+        HttpMethod.POST,
+        "/upload",
+        body=message,
+        headers={"content-type": "multipart/form-data; boundary=boundary"},
+    )
+    set_upload_limits(max_part_size=1024)
+    try:
+        response = app(request)
+    finally:
+        set_upload_limits()
+
+    assert response.status_code == HttpStatus.REQUEST_ENTITY_TOO_LARGE
@@ -1,7 +1,16 @@
 import pytest
 from io import BytesIO
 
-from chocs import HttpCookie, HttpHeaders, HttpMessage, HttpResponse, HttpStatus, JsonHttpMessage
+from chocs import (
+    HttpCookie,
+    HttpHeaders,
+    HttpMessage,
+    HttpResponse,
+    HttpStatus,
+    JsonHttpMessage,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 
 
 def test_can_instantiate() -> None:
@@ -117,8 +126,64 @@ def test_http_response_as_dict() -> None:
     assert response.as_dict() == {"a": 1}
 
 
+def test_json_response() -> None:
+    response = JsonResponse({"a": [1, 2], "b": "ł"}, HttpStatus.CREATED)
+
+    assert response.status_code == HttpStatus.CREATED
+    assert response.headers["content-type"] == "application/json"
+    assert response.body.getvalue() == '{"a":[1,2],"b":"ł"}'.encode("utf-8")
+    assert response.parsed_body.data == {"a": [1, 2], "b": "ł"}
+
+
+def test_json_response_keeps_custom_content_type() -> None:
+    response = JsonResponse([], headers={"content-type": "application/problem+json"})
+
+    assert response.headers["content-type"] == "application/problem+json"
+    assert str(response) == "[]"
+
+
 def test_http_response_parsed_body_as_json_message() -> None:
     body = '{"a": 1}'
     response = HttpResponse(body=body, headers={"content-type": "application/json"})
 
     assert isinstance(response.parsed_body, JsonHttpMessage)
+
+
+def test_streaming_response_is_iterated_lazily() -> None:
+    produced = []
+
+    def generate_rows():
+        for row in ["a\n", "b\n"]:
+            produced.append(row)
+            yield row
+
+    response = StreamingHttpResponse(generate_rows())
+
+    assert produced == []
+    assert response.streaming
+    assert list(response) == [b"a\n", b"b\n"]
+    assert not response.streaming
+
+
+def test_streaming_response_body_reads_remaining_chunks() -> None:
+    response = StreamingHttpResponse(iter([b"a", "b"]))
+
+    assert str(response) == "ab"
+    assert list(response) == [b"ab"]
+
+
+def test_setting_streaming_response_body_closes_content() -> None:
+    def generate_rows():
+        try:
+            yield b"a"
+        finally:
+            closed.append(True)
+
+    closed = []
+    content = generate_rows()
+    next(content)
+    response = StreamingHttpResponse(content)
+    response.body = b""
+
+    assert closed == [True]
+    assert str(response) == ""
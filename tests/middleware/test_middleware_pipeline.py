@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 
 from chocs import HttpRequest, HttpResponse
-from chocs.middleware import Middleware, MiddlewareHandler, MiddlewarePipeline
+from chocs.middleware import AsyncMiddleware, Middleware, MiddlewareHandler, MiddlewarePipeline
 
 
 class ErrorCatchingMiddleware(Middleware):
@@ -69,3 +71,71 @@ def test_successing_pipeline():
     response.body.seek(0)
     assert int(response.status_code) == 201
     assert response.body.read() == b"Proxed Response"
+
+
+def test_pipeline_compiles_chain_once():
+    calls = []
+
+    def tracing_middleware(request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
+        calls.append("trace")
+        return next(request)
+
+    pipeline = MiddlewarePipeline()
+    pipeline.append(tracing_middleware, RespondingMiddleware())
+
+    chain = pipeline.compile()
+    pipeline(HttpRequest("get"))
+    response = pipeline(HttpRequest("get"))
+
+    assert pipeline.compile() is chain
+    assert int(response.status_code) == 201
+    assert calls == ["trace", "trace"]
+
+    pipeline.append(RespondingMiddleware())
+    assert pipeline.compile() is not chain
+
+
+def test_nested_pipeline():
+    def writing_middleware(request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
+        response = next(request)
+        response.write(b"Proxed Response")
+        return response
+
+    inner_pipeline = MiddlewarePipeline()
+    inner_pipeline.append(writing_middleware)
+
+    pipeline = MiddlewarePipeline()
+    pipeline.append(inner_pipeline, RespondingMiddleware())
+
+    response = pipeline(HttpRequest("get"))
+    response.body.seek(0)
+    assert response.body.read() == b"Proxed Response"
+
+
+def test_async_pipeline_mixes_sync_and_async_middleware():
+    calls = []
+
+    async def async_middleware(request: HttpRequest, next) -> HttpResponse:
+        calls.append("async")
+        return await next(request)
+
+    def sync_middleware(request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
+        calls.append("sync")
+        response = next(request)
+        response.write(b"sync")
+        return response
+
+    class AsyncRespondingMiddleware(AsyncMiddleware):
+        async def handle(self, request: HttpRequest, next) -> HttpResponse:
+            calls.append("respond")
+            return HttpResponse(status=201)
+
+    pipeline = MiddlewarePipeline()
+    pipeline.append(async_middleware, sync_middleware, async_middleware, AsyncRespondingMiddleware())
+
+    response = asyncio.run(pipeline.call_async(HttpRequest("get")))
+
+    assert int(response.status_code) == 201
+    assert response.as_str() == "sync"
+    assert calls == ["async", "sync", "async", "respond"]
+    assert pipeline.compile_async() is pipeline.compile_async()
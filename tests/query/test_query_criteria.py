@@ -82,3 +82,12 @@ def test_can_iterate_over_query_criteria() -> None:
     assert len(fields) == 3
     assert fields == list(query.keys())
     assert values == list(query.values())
+
+
+def test_can_generate_next_and_prev_query_with_uri() -> None:
+    # given
+    query = QueryCriteria(HttpQueryString("limit=10&offset=20"))
+
+    # then
+    assert query.next_query(uri="/pets") == "/pets?limit=10&offset=30"
+    assert query.prev_query(uri="/pets?owner=1") == "/pets?owner=1&limit=10&offset=10"
@@ -3,7 +3,7 @@ import os
 import pytest
 from typing import Callable
 
-from chocs import HttpCookie, HttpQueryString, HttpRequest, HttpResponse, Route
+from chocs import HttpCookie, HttpQueryString, HttpRequest, HttpResponse, Route, StreamingHttpResponse
 from chocs.middleware import MiddlewarePipeline
 from chocs.serverless import AwsServerlessFunction, create_http_request_from_aws_event
 
@@ -170,3 +170,15 @@ def test_can_pass_none_in_path_parameters(aws_event: str) -> None:
     # then
     assert response["statusCode"] == 200
 
+
+def test_streaming_response_is_buffered_for_serverless() -> None:
+    def test_callback(request: HttpRequest) -> HttpResponse:
+        return StreamingHttpResponse(chunk for chunk in ["id,name\n", "1,Bob\n"])
+
+    serverless_callback = AwsServerlessFunction(test_callback)
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    event_json = json.load(open(os.path.join(dir_path, "../fixtures/lambda_http_api_event.json")))
+
+    response = serverless_callback(event_json, {})
+
+    assert response["body"] == "id,name\n1,Bob\n"
@@ -1,8 +1,12 @@
+import asyncio
 import pytest
 from inspect import signature
+from typing import Callable
 
-from chocs import Application, HttpMethod, HttpRequest, HttpResponse
+import chocs.middleware.application_middleware
+from chocs import Application, HttpMethod, HttpRequest, HttpResponse, HttpStatus
 from chocs.errors import ApplicationError
+from chocs.middleware import MiddlewareHandler
 
 
 def test_can_load_dynamically_modules_with_const_ending() -> None:
@@ -81,3 +85,159 @@ def test_can_parse_and_compare_default_response() -> None:
     # then
     parsed_body = response.parsed_body
     assert parsed_body == "OK"
+
+
+def test_can_attach_middleware_to_routes_and_groups() -> None:
+    # given
+    calls = []
+
+    def auth_middleware(request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
+        calls.append("auth")
+        if "authorization" not in request.headers:
+            return HttpResponse(status=HttpStatus.UNAUTHORIZED)
+        return next(request)
+
+    def audit_middleware(request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
+        calls.append("audit")
+        return next(request)
+
+    app = Application()
+
+    @app.get("/health")
+    def health(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("OK")
+
+    with app.group("/admin", auth_middleware) as admin:
+
+        @admin.get("/users")
+        def list_users(request: HttpRequest) -> HttpResponse:
+            return HttpResponse("users")
+
+        @admin.delete("/users/{id}", audit_middleware)
+        def delete_user(request: HttpRequest) -> HttpResponse:
+            return HttpResponse(status=HttpStatus.NO_CONTENT)
+
+    # when
+    health_response = app(HttpRequest(HttpMethod.GET, "/health"))
+    health_calls = list(calls)
+    unauthorized_response = app(HttpRequest(HttpMethod.GET, "/admin/users"))
+    users_response = app(HttpRequest(HttpMethod.GET, "/admin/users", headers={"Authorization": "Bearer 1"}))
+    calls.clear()
+    delete_response = app(HttpRequest(HttpMethod.DELETE, "/admin/users/1", headers={"Authorization": "Bearer 1"}))
+
+    # then
+    assert health_response.as_str() == "OK"
+    assert health_calls == []
+    assert unauthorized_response.status_code == HttpStatus.UNAUTHORIZED
+    assert users_response.as_str() == "users"
+    assert delete_response.status_code == HttpStatus.NO_CONTENT
+    assert calls == ["auth", "audit"]
+
+
+def test_can_handle_request_asynchronously() -> None:
+    # given
+    calls = []
+
+    async def timing_middleware(request: HttpRequest, next) -> HttpResponse:
+        calls.append("timing")
+        return await next(request)
+
+    def sync_middleware(request: HttpRequest, next: MiddlewareHandler) -> HttpResponse:
+        calls.append("sync")
+        return next(request)
+
+    app = Application(timing_middleware, sync_middleware)
+
+    @app.get("/async/{id}")
+    async def async_handler(request: HttpRequest) -> HttpResponse:
+        await asyncio.sleep(0)
+        return HttpResponse(f"async {request.path_parameters['id']}")
+
+    @app.get("/sync", timing_middleware)
+    def sync_handler(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("sync")
+
+    async def handle_all() -> list:
+        return await asyncio.gather(
+            app.call_async(HttpRequest(HttpMethod.GET, "/async/1")),
+            app.call_async(HttpRequest(HttpMethod.GET, "/sync")),
+            app.call_async(HttpRequest(HttpMethod.GET, "/missing")),
+            app.call_async(HttpRequest(HttpMethod.HEAD, "/sync")),
+        )
+
+    # when
+    async_response, sync_response, missing_response, head_response = asyncio.run(handle_all())
+
+    # then
+    assert async_response.as_str() == "async 1"
+    assert sync_response.as_str() == "sync"
+    assert missing_response.status_code == HttpStatus.NOT_FOUND
+    assert head_response.status_code == HttpStatus.OK
+    assert head_response.as_str() == ""
+    assert calls.count("timing") == 6
+    assert calls.count("sync") == 4
+
+
+def test_can_handle_coroutines_synchronously() -> None:
+    # given
+    calls = []
+
+    async def timing_middleware(request: HttpRequest, next) -> HttpResponse:
+        calls.append("timing")
+        return await next(request)
+
+    app = Application(timing_middleware)
+
+    @app.get("/async")
+    async def async_handler(request: HttpRequest) -> HttpResponse:
+        await asyncio.sleep(0)
+        return HttpResponse("async")
+
+    @app.get("/sync")
+    def sync_handler(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("sync")
+
+    # when
+    async_response = app(HttpRequest(HttpMethod.GET, "/async"))
+    sync_response = app(HttpRequest(HttpMethod.GET, "/sync"))
+
+    # then
+    assert isinstance(async_response, HttpResponse)
+    assert async_response.as_str() == "async"
+    assert sync_response.as_str() == "sync"
+    assert calls == ["timing", "timing"]
+
+
+def test_fails_to_run_coroutines_synchronously_within_event_loop() -> None:
+    # given
+    app = Application()
+
+    @app.get("/async")
+    async def async_handler(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("async")
+
+    async def call_synchronously() -> HttpResponse:
+        return app(HttpRequest(HttpMethod.GET, "/async"))
+
+    # then
+    with pytest.raises(RuntimeError):
+        asyncio.run(call_synchronously())
+
+
+def test_wraps_route_handlers_for_async_pipeline_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    # given
+    app = Application()
+
+    @app.get("/async")
+    async def async_handler(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("async")
+
+    def _fail(handler: Callable) -> Callable:
+        raise AssertionError("Handler should not be wrapped per request.")
+
+    # when
+    monkeypatch.setattr(chocs.middleware.application_middleware, "as_async_handler", _fail)
+    responses = [asyncio.run(app.call_async(HttpRequest(HttpMethod.GET, "/async"))) for _ in range(2)]
+
+    # then
+    assert [response.as_str() for response in responses] == ["async", "async"]
@@ -2,6 +2,7 @@ import pytest
 import re
 from copy import copy
 from typing import Callable
+from uuid import UUID
 
 from chocs import (
     Application,
@@ -9,10 +10,13 @@ from chocs import (
     HttpRequest,
     HttpResponse,
     HttpStatus,
+    MethodNotAllowedError,
     NotFoundError,
     RequestHandlerMiddleware,
     Route,
+    RouteMatch,
     Router,
+    RouterEngine,
 )
 
 
@@ -141,3 +145,360 @@ def test_can_copy_route() -> None:
     assert route_copy.attributes == match_route.attributes
     assert route_copy.route == match_route.route
     assert route_copy.parameters == match_route.parameters
+
+
+@pytest.mark.parametrize("engine", list(RouterEngine))
+def test_router_matches_routes_by_insertion_order(engine: RouterEngine) -> None:
+    def user_controller() -> None:
+        pass
+
+    def item_controller() -> None:
+        pass
+
+    router = Router(engine)
+    router.append(Route("/users/{user_id}/{item}"), user_controller)
+    router.append(Route("/users/{user_id}/items"), item_controller)
+
+    route, controller = router.match("/users/12/items")
+    assert route.route == "/users/{user_id}/{item}"
+    assert route.parameters == {"user_id": 12, "item": "items"}
+    assert controller is user_controller
+
+
+def test_router_prioritise_static_routes() -> None:
+    def user_controller() -> None:
+        pass
+
+    def me_controller() -> None:
+        pass
+
+    router = Router()
+    router.append(Route("/users/{user_id}"), user_controller)
+    router.append(Route("/users/me"), me_controller)
+    router.append(Route("/users/me/settings"), me_controller)
+
+    route, controller = router.match("/users/me")
+    assert route.route == "/users/me"
+    assert route.parameters == {}
+    assert controller is me_controller
+
+    route, controller = router.match("/USERS/me/Settings")
+    assert route.route == "/users/me/settings"
+    assert controller is me_controller
+
+    route, controller = router.match("/users/you")
+    assert route["user_id"] == "you"
+    assert controller is user_controller
+
+
+@pytest.mark.parametrize(
+    "uri, expected_route, expected_parameters",
+    [
+        ("/files/report.json", "/files/{name}.json", {"name": "report"}),
+        ("/files/report.xml", "/files/*", {}),
+        ("/files/", "/files/*", {}),
+        ("/files/a/b/c", "/files/*", {}),
+        ("/example/12/a/b", "/example/{a}*", {"a": 12}),
+        ("/files", "*", {}),
+        ("/", "*", {}),
+    ],
+)
+@pytest.mark.parametrize("engine", list(RouterEngine))
+def test_router_matches_complex_routes(
+    uri: str, expected_route: str, expected_parameters: dict, engine: RouterEngine
+) -> None:
+    def test_controller() -> None:
+        pass
+
+    router = Router(engine)
+    router.append(Route("/files/*"), test_controller)
+    router.append(Route("/files/{name}.json"), test_controller)
+    router.append(Route("/example/{a}*"), test_controller)
+    router.append(Route("*"), test_controller)
+
+    route, _ = router.match(uri)
+
+    assert route.route == expected_route
+    assert route.parameters == expected_parameters
+
+
+@pytest.mark.parametrize("engine", list(RouterEngine))
+def test_router_matches_routes_regardless_of_their_number(engine: RouterEngine) -> None:
+    def test_controller() -> None:
+        pass
+
+    router = Router(engine)
+    for index in range(500):
+        router.append(Route(f"/resource_{index}/{{id}}/items/{{item_id}}"), test_controller)
+
+    route, _ = router.match("/resource_499/12/items/abc")
+
+    assert route.route == "/resource_499/{id}/items/{item_id}"
+    assert route.parameters == {"id": 12, "item_id": "abc"}
+    with pytest.raises(NotFoundError):
+        router.match("/resource_500/12/items/abc")
+    with pytest.raises(NotFoundError):
+        router.match("/resource_499//items/abc")
+
+
+def test_router_returns_match_referencing_route_definition() -> None:
+    def test_controller() -> None:
+        pass
+
+    route = Route("/pets/{pet_id}", {"name": "get_pet"})
+    router = Router()
+    router.append(route, test_controller)
+
+    match, _ = router.match("/pets/12")
+
+    assert isinstance(match, RouteMatch)
+    assert match.definition is route
+    assert match == route
+    assert match.route == "/pets/{pet_id}"
+    assert match.attributes == {"name": "get_pet"}
+    assert match["pet_id"] == 12
+    assert "pet_id" in match
+    assert match.get("pet_id") == 12
+    assert match.get("category", "none") == "none"
+    assert match.parameters == {"pet_id": 12}
+    assert route.parameters == {}
+
+
+def test_router_caches_resolved_routes() -> None:
+    def test_controller() -> None:
+        pass
+
+    router = Router(cache_size=2)
+    router.append(Route("/pets/{pet_id}"), test_controller)
+
+    first_match, _ = router.match("/pets/1")
+    second_match, _ = router.match("/pets/1")
+    second_match.parameters["pet_id"] = 2
+    third_match, _ = router.match("/pets/1")
+
+    assert first_match.parameters == {"pet_id": 1}
+    assert third_match.parameters == {"pet_id": 1}
+    assert router.cache_info() == (2, 1, 0, 2, 1)
+
+    router.match("/pets/2")
+    router.match("/pets/3")
+    assert router.cache_info() == (2, 3, 1, 2, 2)
+
+    router.append(Route("/pets/{pet_id}/owner"), test_controller)
+    assert router.cache_info().currsize == 0
+
+
+def test_router_cache_is_disabled_by_default() -> None:
+    assert Router().cache_info() is None
+
+
+@pytest.mark.parametrize("engine", list(RouterEngine))
+def test_router_can_register_routes_in_bulk_and_freeze(engine: RouterEngine) -> None:
+    def pet_controller() -> None:
+        pass
+
+    def any_controller() -> None:
+        pass
+
+    router = Router(engine)
+    router.extend(
+        [
+            (Route("*"), any_controller, "*"),
+            (Route("/pets/{pet_id}"), pet_controller, [HttpMethod.GET, HttpMethod.DELETE]),
+        ]
+    )
+    router.freeze()
+
+    route, controller = router.match("/pets/1", HttpMethod.DELETE)
+    assert route.route == "/pets/{pet_id}"
+    assert controller is pet_controller
+    # wildcard route was registered first, but routes without wildcards take precedence
+    route, controller = router.match("/pets/1", HttpMethod.GET)
+    assert controller is pet_controller
+    route, controller = router.match("/owners/1", HttpMethod.GET)
+    assert controller is any_controller
+
+    router.append(Route("/pets/{pet_id}/owner"), pet_controller)
+    route, controller = router.match("/pets/1/owner")
+    assert route.route == "/pets/{pet_id}/owner"
+
+
+def test_router_raises_method_not_allowed_with_allowed_methods() -> None:
+    def test_controller() -> None:
+        pass
+
+    router = Router()
+    router.append(Route("/pets"), test_controller, [HttpMethod.GET, HttpMethod.POST])
+    router.append(Route("/pets/{pet_id}"), test_controller, [HttpMethod.GET])
+    router.append(Route("/pets/*"), test_controller, [HttpMethod.DELETE])
+
+    assert router.allowed_methods("/PETS") == [HttpMethod.GET, HttpMethod.POST]
+    assert router.allowed_methods("/pets/1") == [HttpMethod.GET, HttpMethod.DELETE]
+    assert router.allowed_methods("/owners") == []
+
+    with pytest.raises(MethodNotAllowedError) as error:
+        router.match("/pets/1", HttpMethod.PATCH)
+    assert error.value.allowed_methods == ["GET", "DELETE"]
+    assert error.value.headers == {"Allow": "GET, DELETE"}
+
+    with pytest.raises(MethodNotAllowedError):
+        router.match("/pets", HttpMethod.DELETE)
+
+    with pytest.raises(NotFoundError):
+        router.match("/owners", HttpMethod.GET)
+
+
+def test_application_responds_with_method_not_allowed() -> None:
+    app = Application()
+
+    @app.get("/pets/{pet_id}")
+    def get_pet(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(f"pet {request.path_parameters['pet_id']}")
+
+    @app.delete("/pets/{pet_id}")
+    def delete_pet(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(status=HttpStatus.NO_CONTENT)
+
+    response = app(HttpRequest(HttpMethod.POST, "/pets/1"))
+    assert response.status_code == HttpStatus.METHOD_NOT_ALLOWED
+    assert response.headers["Allow"] == "GET, HEAD, DELETE, OPTIONS"
+
+    response = app(HttpRequest(HttpMethod.OPTIONS, "/pets/1"))
+    assert response.status_code == HttpStatus.NO_CONTENT
+    assert response.headers["Allow"] == "GET, HEAD, DELETE, OPTIONS"
+
+    response = app(HttpRequest(HttpMethod.HEAD, "/pets/1"))
+    assert response.status_code == HttpStatus.OK
+    assert response.as_str() == ""
+    assert response.headers["content-length"] == "5"
+
+    first_request = HttpRequest(HttpMethod.HEAD, "/pets/1")
+    second_request = HttpRequest(HttpMethod.HEAD, "/pets/2")
+    app(first_request)
+    app(second_request)
+    assert first_request.attributes["__handler__"] is second_request.attributes["__handler__"]
+
+    response = app(HttpRequest(HttpMethod.GET, "/pets/1"))
+    assert response.as_str() == "pet 1"
+
+    response = app(HttpRequest(HttpMethod.OPTIONS, "/owners"))
+    assert response.status_code == HttpStatus.NOT_FOUND
+
+
+@pytest.mark.parametrize("engine", list(RouterEngine))
+def test_router_casts_typed_parameters(engine: RouterEngine) -> None:
+    def test_controller() -> None:
+        pass
+
+    router = Router(engine)
+    router.append(Route("/users/{id:int}"), test_controller)
+    router.append(Route("/users/{name:str}"), test_controller)
+    router.append(Route("/files/{path:path}"), test_controller)
+    router.append(Route("/prices/{price:float}/{uuid:uuid}"), test_controller)
+
+    route, _ = router.match("/users/12")
+    assert route.route == "/users/{id:int}"
+    assert route.parameters == {"id": 12}
+
+    route, _ = router.match("/users/1e5")
+    assert route.route == "/users/{name:str}"
+    assert route.parameters == {"name": "1e5"}
+
+    route, _ = router.match("/files/reports/2021/summary%20q1.pdf")
+    assert route.parameters == {"path": "reports/2021/summary q1.pdf"}
+
+    route, _ = router.match("/prices/12.5/0f0b1d3e-8a5b-4f6e-9c1d-2a3b4c5d6e7f")
+    assert route.parameters == {"price": 12.5, "uuid": UUID("0f0b1d3e-8a5b-4f6e-9c1d-2a3b4c5d6e7f")}
+
+    with pytest.raises(NotFoundError):
+        router.match("/prices/abc/0f0b1d3e-8a5b-4f6e-9c1d-2a3b4c5d6e7f")
+
+
+def test_route_fails_for_unknown_converter() -> None:
+    with pytest.raises(ValueError):
+        Route("/users/{id:unknown}")
+
+
+def test_router_matches_routes_by_host() -> None:
+    def api_controller() -> None:
+        pass
+
+    def tenant_controller() -> None:
+        pass
+
+    def default_controller() -> None:
+        pass
+
+    router = Router()
+    router.append(Route("/users"), api_controller, HttpMethod.GET, host="api.example.com")
+    router.append(Route("/users/{id}"), tenant_controller, HttpMethod.GET, host="{tenant}.example.com")
+    router.append(Route("/health"), default_controller)
+
+    _, controller = router.match("/users", HttpMethod.GET, "API.example.com:8080")
+    assert controller is api_controller
+
+    route, controller = router.match("/users/12", HttpMethod.GET, "acme.example.com")
+    assert controller is tenant_controller
+    assert route.parameters == {"id": 12, "tenant": "acme"}
+
+    _, controller = router.match("/health", HttpMethod.GET, "acme.example.com")
+    assert controller is default_controller
+
+    with pytest.raises(NotFoundError):
+        router.match("/users", HttpMethod.GET, "example.org")
+    with pytest.raises(NotFoundError):
+        router.match("/users")
+    with pytest.raises(MethodNotAllowedError):
+        router.match("/users", HttpMethod.POST, "api.example.com")
+
+
+def test_application_routes_by_host() -> None:
+    app = Application()
+
+    with app.host("{tenant}.example.com") as tenant_app:
+
+        @tenant_app.get("/info")
+        def tenant_info(request: HttpRequest) -> HttpResponse:
+            return HttpResponse(f"tenant {request.path_parameters['tenant']}")
+
+    @app.get("/info")
+    def info(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("default")
+
+    response = app(HttpRequest(HttpMethod.GET, "/info", headers={"Host": "acme.example.com"}))
+    assert response.as_str() == "tenant acme"
+
+    response = app(HttpRequest(HttpMethod.GET, "/info", headers={"Host": "example.org"}))
+    assert response.as_str() == "default"
+
+    response = app(HttpRequest(HttpMethod.GET, "/info"))
+    assert response.as_str() == "default"
+
+
+def test_application_builds_urls_for_named_routes() -> None:
+    app = Application()
+
+    with app.group("/pets") as pets:
+
+        @pets.get("/{pet_id:int}/photos/{path:path}", name="pet_photo")
+        def get_pet_photo(request: HttpRequest) -> HttpResponse:
+            return HttpResponse()
+
+    @app.get("/pets", name="list_pets")
+    def list_pets(request: HttpRequest) -> HttpResponse:
+        return HttpResponse()
+
+    assert app.url_for("pet_photo", pet_id=12, path="2021/my cat.jpg") == "/pets/12/photos/2021/my%20cat.jpg"
+    assert app.url_for("list_pets") == "/pets"
+    assert app.url_for("list_pets", limit=10, tags=["a", "b"]) == "/pets?limit=10&tags=a&tags=b"
+
+    with pytest.raises(ValueError):
+        app.url_for("pet_photo", pet_id=12)
+    with pytest.raises(KeyError):
+        app.url_for("unknown")
+
+
+def test_route_builds_uri() -> None:
+    assert Route("/pets/{pet_id}/{ category }").build({"pet_id": 1, "category": "a/b"}) == "/pets/1/a%2Fb"
+    with pytest.raises(ValueError):
+        Route("/pets/*").build()
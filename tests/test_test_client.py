@@ -1,4 +1,4 @@
-from chocs import Application, HttpStatus
+from chocs import Application, HttpRequest, HttpResponse, HttpStatus, JsonResponse
 from chocs.testing import TestClient
 from tests.fixtures.app_fixture import app
 
@@ -47,3 +47,15 @@ class TestTestClient:
         response = client.head("/test")
         assert response.status_code == HttpStatus.OK
         assert response.as_str() == "test head"
+
+    def test_post_json(self) -> None:
+        json_app = Application()
+
+        @json_app.post("/echo")
+        def echo(request: HttpRequest) -> HttpResponse:
+            return JsonResponse(request.parsed_body.data)
+
+        client = TestClient(json_app)
+        response = client.post("/echo", json={"a": [1, 2]})
+        assert response.headers["content-type"] == "application/json"
+        assert response.as_dict() == {"a": [1, 2]}
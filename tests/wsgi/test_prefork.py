@@ -0,0 +1,97 @@
+import os
+import signal
+import socket
+import time
+from urllib.request import urlopen
+
+import pytest
+
+from chocs import Application, HttpRequest, HttpResponse
+from chocs.wsgi.prefork_support import REUSE_PORT, PreforkServer, PreforkWorker, create_listening_socket
+from chocs.wsgi.wsgi_support import create_wsgi_handler
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _request(port: int, path: str) -> str:
+    for _ in range(50):
+        try:
+            with urlopen(f"http://127.0.0.1:{port}{path}", timeout=5) as response:
+                return response.read().decode()
+        except (ConnectionError, OSError):
+            time.sleep(0.1)
+
+    raise TimeoutError("Server did not respond.")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="prefork server requires os.fork")
+def test_prefork_server_recycles_workers_and_stops_gracefully() -> None:
+    app = Application()
+
+    @app.get("/pid")
+    def get_pid(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(str(os.getpid()))
+
+    port = _get_free_port()
+    server_pid = os.fork()
+    if not server_pid:
+        try:
+            PreforkServer(create_wsgi_handler(app), "127.0.0.1", port, workers=1, max_requests=2).run()
+        finally:
+            os._exit(0)
+
+    try:
+        worker_pids = [_request(port, "/pid") for _ in range(4)]
+    finally:
+        os.kill(server_pid, signal.SIGTERM)
+        _, status = os.waitpid(server_pid, 0)
+
+    assert worker_pids[0] == worker_pids[1]
+    assert worker_pids[2] == worker_pids[3]
+    assert worker_pids[1] != worker_pids[2]
+    assert os.WIFEXITED(status)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork") or not REUSE_PORT, reason="requires os.fork and SO_REUSEPORT")
+def test_prefork_server_balances_connections_between_workers() -> None:
+    app = Application()
+
+    @app.get("/pid")
+    def get_pid(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(str(os.getpid()))
+
+    port = _get_free_port()
+    server_pid = os.fork()
+    if not server_pid:
+        try:
+            PreforkServer(create_wsgi_handler(app), "127.0.0.1", port, workers=2).run()
+        finally:
+            os._exit(0)
+
+    try:
+        _request(port, "/pid")
+        time.sleep(0.5)  # let the other worker start listening
+        worker_pids = {_request(port, "/pid") for _ in range(20)}
+    finally:
+        os.kill(server_pid, signal.SIGTERM)
+        os.waitpid(server_pid, 0)
+
+    assert len(worker_pids) == 2
+
+
+def test_prefork_worker_accepts_blocking_connections() -> None:
+    sock = create_listening_socket("127.0.0.1", 0, shared=True)
+    server = PreforkWorker(lambda environ, start: [], sock)._create_server()
+
+    with socket.create_connection(sock.getsockname()[:2]):
+        time.sleep(0.1)
+        conn, _ = server.get_request()
+
+    assert not sock.getblocking()
+    assert conn.getblocking()
+    conn.close()
+    sock.close()
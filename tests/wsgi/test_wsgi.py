@@ -1,16 +1,26 @@
 from io import BytesIO
 from typing import Callable
 
-from chocs import Application, HttpCookie, HttpMethod, HttpRequest, HttpResponse
-from chocs.wsgi.wsgi_support import create_wsgi_handler
+from chocs import (
+    Application,
+    FileResponse,
+    HttpCookie,
+    HttpMethod,
+    HttpRequest,
+    HttpResponse,
+    HttpStatus,
+    StreamingHttpResponse,
+)
+from chocs.wsgi.wsgi_support import create_wsgi_handler, serialise_wsgi_response
 
 
 def test_create_wsgi_handler() -> None:
     def _http_start(status_code, headers):
         assert headers == [
             ("content-type", "text/plain"),
+            ("content-length", "2"),
         ]
-        assert status_code == "200"
+        assert status_code == "200 OK"
 
     def _serve_response(request: HttpRequest, next: Callable) -> HttpResponse:
         assert request.method == HttpMethod.POST
@@ -33,9 +43,10 @@ def test_handling_cookies_by_wsgi_handler() -> None:
     def _http_start(status_code, headers):
         assert headers == [
             ("content-type", "text/plain"),
+            ("content-length", "2"),
             ("set-cookie", "test=SuperCookie"),
         ]
-        assert status_code == "200"
+        assert status_code == "200 OK"
 
     def _serve_response(request: HttpRequest, next: Callable) -> HttpResponse:
         assert request.method == HttpMethod.POST
@@ -55,3 +66,189 @@ def test_handling_cookies_by_wsgi_handler() -> None:
         },
         _http_start,
     )
+
+
+def test_wsgi_handler_reads_body_lazily() -> None:
+    wsgi_input = BytesIO(b"Test input|next request")
+
+    def _http_start(status_code, headers):
+        assert status_code == "200 OK"
+
+    def _serve_response(request: HttpRequest, next: Callable) -> HttpResponse:
+        assert wsgi_input.tell() == 0
+        return HttpResponse(request.body.read())
+
+    app = Application(_serve_response)
+    handler = create_wsgi_handler(app)
+
+    response = handler(
+        {
+            "CONTENT_TYPE": "text/plain",
+            "CONTENT_LENGTH": "10",
+            "REQUEST_METHOD": "POST",
+            "wsgi.input": wsgi_input,
+        },
+        _http_start,
+    )
+
+    assert response.read() == b"Test input"
+    assert wsgi_input.read() == b"|next request"
+
+
+def test_wsgi_handler_passes_streaming_response_through() -> None:
+    def _http_start(status_code, headers):
+        assert "content-length" not in dict(headers)
+
+    app = Application()
+
+    @app.get("/export")
+    def export(request: HttpRequest) -> HttpResponse:
+        return StreamingHttpResponse(f"{row}\n" for row in range(3))
+
+    response = create_wsgi_handler(app)({"REQUEST_METHOD": "GET", "PATH_INFO": "/export"}, _http_start)
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert list(response) == [b"0\n", b"1\n", b"2\n"]
+
+
+def test_wsgi_handler_uses_file_wrapper_for_file_responses(tmp_path) -> None:
+    path = tmp_path / "report.txt"
+    path.write_bytes(b"0123456789")
+
+    class FileWrapper:
+        def __init__(self, file, block_size):
+            self.file = file
+            self.block_size = block_size
+
+    def _http_start(status_code, headers):
+        assert dict(headers)["content-length"] == "3"
+
+    app = Application()
+
+    @app.get("/report")
+    def report(request: HttpRequest) -> HttpResponse:
+        return FileResponse(str(path), request)
+
+    response = create_wsgi_handler(app)(
+        {"REQUEST_METHOD": "GET", "PATH_INFO": "/report", "HTTP_RANGE": "bytes=7-", "wsgi.file_wrapper": FileWrapper},
+        _http_start,
+    )
+
+    assert isinstance(response, FileWrapper)
+    assert response.file.tell() == 7
+    assert response.file.read() == b"789"
+    response.file.close()
+
+
+def test_wsgi_handler_sends_no_content_length_for_not_modified_file(tmp_path) -> None:
+    path = tmp_path / "report.txt"
+    path.write_bytes(b"0123456789")
+    app = Application()
+    calls = []
+
+    @app.get("/report")
+    def report(request: HttpRequest) -> HttpResponse:
+        return FileResponse(str(path), request)
+
+    etag = FileResponse(str(path)).etag
+    response = create_wsgi_handler(app)(
+        {"REQUEST_METHOD": "GET", "PATH_INFO": "/report", "HTTP_IF_NONE_MATCH": etag, "wsgi.input": BytesIO(b"")},
+        lambda status_code, headers: calls.append((status_code, dict(headers))),
+    )
+
+    assert calls[0][0] == "304 Not Modified"
+    assert "content-length" not in calls[0][1]
+    assert b"".join(response) == b""
+
+
+def test_wsgi_handler_sends_no_content_length_for_no_content_responses() -> None:
+    app = Application()
+    calls = []
+
+    @app.delete("/items/{id}")
+    def delete_item(request: HttpRequest) -> HttpResponse:
+        return HttpResponse(status=HttpStatus.NO_CONTENT)
+
+    handler = create_wsgi_handler(app)
+    for method in ["DELETE", "OPTIONS"]:
+        handler(
+            {"REQUEST_METHOD": method, "PATH_INFO": "/items/1", "wsgi.input": BytesIO(b"")},
+            lambda status_code, headers: calls.append((status_code, dict(headers))),
+        )
+
+    assert [status_code for status_code, _ in calls] == ["204 No Content", "204 No Content"]
+    assert all("content-length" not in headers for _, headers in calls)
+
+
+def test_wsgi_handler_sends_no_body_and_length_for_head_of_streaming_route(tmp_path) -> None:
+    path = tmp_path / "report.txt"
+    path.write_bytes(b"0123456789")
+    app = Application()
+    calls = []
+
+    @app.get("/numbers")
+    def numbers(request: HttpRequest) -> HttpResponse:
+        return StreamingHttpResponse(f"{number}\n" for number in range(3))
+
+    @app.get("/report")
+    def report(request: HttpRequest) -> HttpResponse:
+        return FileResponse(str(path), request)
+
+    handler = create_wsgi_handler(app)
+    bodies = [
+        b"".join(
+            handler(
+                {
+                    "REQUEST_METHOD": "HEAD",
+                    "PATH_INFO": path_info,
+                    "wsgi.input": BytesIO(b""),
+                    "wsgi.file_wrapper": iter,
+                },
+                lambda status_code, headers: calls.append((status_code, dict(headers))),
+            )
+        )
+        for path_info in ["/numbers", "/report"]
+    ]
+
+    assert bodies == [b"", b""]
+    assert [status_code for status_code, _ in calls] == ["200 OK", "200 OK"]
+    assert "content-length" not in calls[0][1]
+    assert calls[1][1]["content-length"] == "10"
+
+
+def test_wsgi_handler_does_not_modify_response_headers() -> None:
+    response = HttpResponse("Created", 201)
+    response.cookies.append(HttpCookie(name="test", value="SuperCookie"))
+
+    status, headers = serialise_wsgi_response(response)
+    serialise_wsgi_response(response)
+
+    assert status == "201 Created"
+    assert headers == [
+        ("content-type", "text/plain"),
+        ("content-length", "7"),
+        ("set-cookie", "test=SuperCookie"),
+    ]
+    assert "set-cookie" not in response.headers
+
+
+def test_wsgi_handler_runs_coroutine_middleware_and_handlers() -> None:
+    async def _middleware(request: HttpRequest, next: Callable) -> HttpResponse:
+        response = await next(request)
+        response.headers.set("x-middleware", "async")
+        return response
+
+    app = Application(_middleware)
+
+    @app.get("/")
+    async def _handler(request: HttpRequest) -> HttpResponse:
+        return HttpResponse("OK")
+
+    started = []
+    body = create_wsgi_handler(app)(
+        {"REQUEST_METHOD": "GET", "PATH_INFO": "/", "wsgi.input": BytesIO(b"")},
+        lambda status, headers: started.append((status, headers)),
+    )
+
+    assert started == [("200 OK", [("content-type", "text/plain"), ("x-middleware", "async"), ("content-length", "2")])]
+    assert b"".join(body) == b"OK"
@@ -0,0 +1,41 @@
+from io import BytesIO
+
+from chocs import HttpMethod
+from chocs.wsgi.wsgi_http_request import WsgiHttpRequest
+
+
+def test_request_is_created_lazily_from_environ() -> None:
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": "/pets",
+        "QUERY_STRING": "name=Bob&age=2",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": "2",
+        "HTTP_X_REQUEST_ID": "abc",
+        "HTTP_COOKIE": "session=1",
+        "wsgi.input": BytesIO(b"{}"),
+    }
+    request = WsgiHttpRequest(environ)
+
+    assert request.method == HttpMethod.POST
+    assert request.path == "/pets"
+    assert request._lazy_headers is None
+    assert request._lazy_query_string is None
+
+    assert request.headers["x-request-id"] == "abc"
+    assert request.headers["content-type"] == "application/json"
+    assert request.query_string["name"] == "Bob"
+    assert request.query_string["age"] == 2
+    assert request.cookies["session"].value == "1"
+    assert request.parsed_body.data == {}
+    assert request.headers is request.headers
+
+
+def test_can_override_lazy_request_values() -> None:
+    request = WsgiHttpRequest({"REQUEST_METHOD": "get"})
+
+    request.query_string = {"page": 1}  # type: ignore
+
+    assert request.method == HttpMethod.GET
+    assert request.query_string == {"page": 1}
+    assert request.body.read() == b""